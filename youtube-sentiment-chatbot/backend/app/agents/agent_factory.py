@@ -1,62 +1,84 @@
 """Agent factory functions for creating LangChain agents with LangGraph integration.
 
 This module provides:
-- Agent creation with OpenAI function calling
+- Agent creation with OpenAI tool calling (parallel tool calls)
 - Agent node wrappers for LangGraph integration
 - Special document-preserving wrapper for CommentFinder agent
 """
 
-from functools import partial
-from typing import List
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING
 
-from langchain_classic.agents import AgentExecutor, create_openai_functions_agent
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from langchain_core.messages import HumanMessage
-from langchain_openai import ChatOpenAI
+
+if TYPE_CHECKING:
+    from langchain_classic.agents import AgentExecutor
+    from langchain_openai import ChatOpenAI
+
+from app.core.prompts import AGENT_SUFFIX, AUGMENTED_PROMPTS
 
 
 # Autonomy enhancement text added to all agent system prompts
-AUTONOMY_ENHANCEMENT = (
-    "\nWork autonomously according to your specialty, using the tools available to you."
-    " Do not ask for clarification."
-    " Your other team members (and other teams) will collaborate with you with their own specialties."
-    " You are chosen for a reason!"
-)
+# (precompiled into AUGMENTED_PROMPTS at import time)
+AUTONOMY_ENHANCEMENT = AGENT_SUFFIX
+
+
+@lru_cache(maxsize=64)
+def _build_agent_prompt(system_prompt: str) -> ChatPromptTemplate:
+    """Build (and cache) the agent prompt template for a system prompt."""
+    return ChatPromptTemplate.from_messages(
+        [
+            ("system", system_prompt),
+            MessagesPlaceholder(variable_name="messages"),
+            MessagesPlaceholder(variable_name="agent_scratchpad"),
+        ]
+    )
 
 
 def create_agent(
-    llm: ChatOpenAI,
+    llm: "ChatOpenAI",
     tools: list,
-    system_prompt: str,
-) -> AgentExecutor:
-    """Create a function-calling agent and add it to the graph.
+    prompt_key: str,
+    *,
+    return_intermediate_steps: bool = False,
+) -> "AgentExecutor":
+    """Create a tool-calling agent and add it to the graph.
+
+    The model may emit several tool calls in one step; AgentExecutor runs
+    them concurrently (asyncio.gather) when the agent is invoked
+    asynchronously, as every agent node does. Tools should be async so
+    the gathered calls do not each take a thread-pool slot.
 
     Args:
         llm: ChatOpenAI instance for the agent
         tools: List of tools the agent can use
-        system_prompt: System instructions for the agent
+        prompt_key: Agent name in AGENT_PROMPTS whose suffixed system prompt to use
+        return_intermediate_steps: Keep tool observations in the result (only
+            needed by agent_node_with_docs to extract retrieved documents)
 
     Returns:
         AgentExecutor configured with the agent and tools
     """
-    system_prompt += AUTONOMY_ENHANCEMENT
+    # Imported lazily: langchain_classic.agents is heavy and only needed at graph build time
+    from langchain_classic.agents import AgentExecutor, create_openai_tools_agent
 
-    prompt = ChatPromptTemplate.from_messages(
-        [
-            ("system", system_prompt),
-            MessagesPlaceholder(variable_name="messages"),
-            MessagesPlaceholder(variable_name="agent_scratchpad"),
-        ]
-    )
+    prompt = _build_agent_prompt(AUGMENTED_PROMPTS[prompt_key])
 
-    agent = create_openai_functions_agent(llm, tools, prompt)
-    executor = AgentExecutor(agent=agent, tools=tools, return_intermediate_steps=True)
+    agent = create_openai_tools_agent(llm.bind(parallel_tool_calls=True), tools, prompt)
+    executor = AgentExecutor(
+        agent=agent,
+        tools=tools,
+        return_intermediate_steps=return_intermediate_steps,
+    )
     return executor
 
 
-def agent_node(state, agent, name):
+async def agent_node(state, agent, name):
     """Standard agent execution wrapper for LangGraph.
 
+    Runs as a coroutine so sibling nodes can overlap their LLM round-trips.
+
     Args:
         state: Current graph state
         agent: AgentExecutor instance
@@ -65,14 +87,14 @@ def agent_node(state, agent, name):
     Returns:
         Dictionary with messages and documents
     """
-    result = agent.invoke(state)
+    result = await agent.ainvoke(state)
     return {
         "messages": [HumanMessage(content=result["output"], name=name)],
         "documents": result.get("documents", [])
     }
 
 
-def agent_node_with_docs(state, agent, name):
+async def agent_node_with_docs(state, agent, name):
     """Special wrapper for CommentFinder agent that preserves documents.
 
     This function extracts documents from intermediate_steps because the
@@ -86,23 +108,26 @@ def agent_node_with_docs(state, agent, name):
     Returns:
         Dictionary with messages and preserved documents
     """
-    result = agent.invoke(state)
+    # Only CommentFinder returns documents; other agents take the plain path
+    if name != "CommentFinder":
+        return await agent_node(state, agent, name)
+
+    result = await agent.ainvoke(state)
     output = result["output"]
 
-    # Try to extract documents if this is CommentFinder
-    documents = []
-    if name == "CommentFinder":
-        # Parse the output to extract documents if they're returned
-        # The tool returns a dict, but agent wraps it as string
-        # We need to access the raw tool result
-        try:
-            # Get the intermediate steps from agent execution
-            if "intermediate_steps" in result:
-                for action, observation in result["intermediate_steps"]:
-                    if isinstance(observation, dict) and "documents" in observation:
-                        documents = observation["documents"]
-        except Exception:
-            documents = []
+    # Parse the output to extract documents if they're returned
+    # The tool returns a dict, but agent wraps it as string
+    # We need to access the raw tool result (latest retrieval wins)
+    documents = next(
+        (
+            observation["documents"]
+            for action, observation in reversed(result.get("intermediate_steps", ()))
+            if action.tool == "retrieve_information"
+            and isinstance(observation, dict)
+            and "documents" in observation
+        ),
+        [],
+    )
 
     return {
         "messages": [HumanMessage(content=output, name=name)],
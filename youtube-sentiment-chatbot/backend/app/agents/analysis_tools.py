@@ -3,6 +3,10 @@
 This module provides reflection tools for:
 - Sentiment analysis quality assurance
 - Topic extraction quality assurance
+
+The tools only format their input, so they are coroutines: concurrent tool
+calls gathered by the agent executor run on the event loop without a
+thread-pool hop each.
 """
 
 from typing import Annotated
@@ -10,7 +14,7 @@ from langchain_core.tools import tool
 
 
 @tool(description="Sentiment analysis reflection tool for quality decision-making")
-def sentiment_think_tool(reflection: str) -> str:
+async def sentiment_think_tool(reflection: str) -> str:
     """Tool for strategic reflection during sentiment analysis workflows.
 
     Use this tool to pause and reflect on sentiment analysis progress, ensuring high-quality insights.
@@ -37,7 +41,7 @@ def sentiment_think_tool(reflection: str) -> str:
 
 
 @tool(description="Topic extraction reflection tool for quality categorization")
-def topic_think_tool(reflection: str) -> str:
+async def topic_think_tool(reflection: str) -> str:
     """Tool for strategic reflection during topic extraction workflows.
 
     Use this tool to pause and reflect on topic discovery progress, ensuring comprehensive theme identification.
@@ -63,7 +67,7 @@ def topic_think_tool(reflection: str) -> str:
     return f"Topic extraction reflection recorded: {reflection}"
 
 @tool(description="Strategic reflection tool for routing plan with dependency analysis")
-def supervisor_think_tool(reflection: str) -> str:
+async def supervisor_think_tool(reflection: str) -> str:
     """Tool for strategic reflection on progress, decision-making, and DEPENDENCY CHECKING.
 
     Use this tool BEFORE routing to any agent to ensure all prerequisites are met.
@@ -5,19 +5,18 @@ This module provides:
 - retrieve_information: RAG retrieval returning response + documents
 """
 
-from typing import Annotated, List
+import hashlib
+from functools import lru_cache
+from typing import TYPE_CHECKING, Annotated, List
+
 from langchain_core.tools import tool
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import StrOutputParser
-from langchain_openai import ChatOpenAI
-from langchain_tavily import TavilySearch
-
 
-# Global state for document preservation (set by retrieve_information tool)
-_retrieved_documents = []
+if TYPE_CHECKING:
+    from langchain_core.runnables import Runnable
+    from langchain_tavily import TavilySearch
 
-# Tavily search instance
-tavily = TavilySearch(max_results=5)
 
 # Summarization chain for transcript compression
 SUMMARIZATION_TEMPLATE = (
@@ -33,9 +32,96 @@ SUMMARIZATION_TEMPLATE = (
     "\nUse short sentences separated by semicolons. If the transcript excerpt is empty, respond with 'No transcript available.'"
 )
 
-summarization_llm = ChatOpenAI(model='gpt-4o-mini')
 chat_summarization_prompt = ChatPromptTemplate.from_messages([("human", SUMMARIZATION_TEMPLATE)])
-summarization_chain = chat_summarization_prompt | summarization_llm | StrOutputParser()
+
+
+# langchain_openai and langchain_tavily are imported on first use to keep them
+# off the import path of cold starts
+
+
+@lru_cache(maxsize=1)
+def get_tavily() -> "TavilySearch":
+    """Return the shared Tavily search instance (its HTTP connection pool is reused across searches)."""
+    from langchain_tavily import TavilySearch
+
+    return TavilySearch(max_results=5)
+
+
+@lru_cache(maxsize=1)
+def get_summarization_chain() -> "Runnable":
+    """Return the shared summarization chain for transcript compression."""
+    from langchain_openai import ChatOpenAI
+
+    summarization_llm = ChatOpenAI(model='gpt-4o-mini')
+    return chat_summarization_prompt | summarization_llm | StrOutputParser()
+
+
+@lru_cache(maxsize=256)
+def _summarize(title: str, channel: str, transcript_hash: str, transcript: str) -> str:
+    """Summarize a transcript, memoized per (title, channel, transcript hash).
+
+    Repeated searches about the same video reuse the summary instead of
+    re-running the summarization LLM on the full transcript.
+    """
+    return get_summarization_chain().invoke(
+        {
+            "title": title,
+            "channel": channel,
+            "transcript": transcript,
+        }
+    )
+
+
+# Tavily result formatters, dispatched on the type of the search results
+def _fmt_str(results: str) -> List[str]:
+    """Format results that are already a formatted string."""
+    return ["### Search Results", results]
+
+
+def _fmt_list_item(index: int, result) -> str:
+    """Format one entry of a list of search results."""
+    if isinstance(result, dict):
+        return (
+            f"### Result {index}\n"
+            f"**URL:** {result.get('url', 'N/A')}\n"
+            f"**Title:** {result.get('title', 'N/A')}\n"
+            f"**Summary:** {result.get('content', 'No content available')}"
+        )
+    return f"### Result {index}\n**Content:** {result}"
+
+
+def _fmt_list(results: list) -> List[str]:
+    """Format a list of search results (top 4)."""
+    return [_fmt_list_item(index, result) for index, result in enumerate(results[:4], start=1)]
+
+
+def _fmt_dict(results: dict) -> List[str]:
+    """Format a single search result dict."""
+    return [
+        "### Search Result",
+        f"**URL:** {results.get('url', 'N/A')}",
+        f"**Title:** {results.get('title', 'N/A')}",
+        f"**Content:** {results.get('content', 'No content available')}",
+    ]
+
+
+def _fmt_default(results) -> List[str]:
+    """Fallback for unknown result formats."""
+    return [f"**Results:** {results}"]
+
+
+_FORMATTERS = {str: _fmt_str, list: _fmt_list, dict: _fmt_dict}
+
+
+def _format_search_results(title: str, channel: str, enhanced_query: str, results) -> str:
+    """Render Tavily results with a header describing the video and query."""
+    output_lines = [
+        f"## Search Results for: {title or 'Unknown Video'}",
+        f"**Channel:** {channel or 'Unknown Channel'}",
+        f"**Enhanced Query:** {enhanced_query}\n",
+    ]
+    output_lines.extend(_FORMATTERS.get(type(results), _fmt_default)(results))
+    return "\n".join(output_lines)
 
 
 def create_video_specific_search_tool(title: str, channel: str, transcript: str):
@@ -49,8 +135,25 @@ def create_video_specific_search_tool(title: str, channel: str, transcript: str)
     Returns:
         Tool function for Tavily search enhanced with video context
     """
+    # The summary depends only on the bound video context, so compute it once here
+    # rather than on every search call
+    if transcript:
+        transcript_hash = hashlib.blake2b(transcript.encode(), digest_size=16).hexdigest()
+        precomputed_summary = _summarize(title, channel, transcript_hash, transcript)
+    else:
+        precomputed_summary = ""
+
+    search_context: List[str] = []
+    if title:
+        search_context.append(f'"{title}"')
+    if channel:
+        search_context.append(f"channel:{channel}")
+    if precomputed_summary:
+        search_context.append(f"transcript summary: {precomputed_summary}")
+    context_suffix = " ".join(search_context)
+
     @tool
-    def video_specific_search(
+    async def video_specific_search(
         query: Annotated[str, "Search query - can be about the current video's topic OR to find other related videos"]
     ) -> str:
         """Search for external information using web search (Tavily).
@@ -63,56 +166,16 @@ def create_video_specific_search_tool(title: str, channel: str, transcript: str)
 
         The search automatically includes the current video's title and channel for context.
         """
-        search_context: List[str] = []
-        if title:
-            search_context.append(f'"{title}"')
-        if channel:
-            search_context.append(f"channel:{channel}")
-        if transcript:
-            summary = summarization_chain.invoke(
-                {
-                    "title": title,
-                    "channel": channel,
-                    "transcript": transcript,
-                }
-            )
-            search_context.append(f"transcript summary: {summary}")
-
-        enhanced_query = f"{query} {' '.join(search_context)}" if search_context else query
+        # Fast path: no video context to add, search with the raw query
+        if not context_suffix:
+            results = await get_tavily().ainvoke(query)
+            return _format_search_results(title, channel, query, results)
+
+        enhanced_query = f"{query} {context_suffix}"
 
         # Tavily can return different formats - handle all cases
-        results = tavily.invoke(enhanced_query)
-
-        output_lines = [f"## Search Results for: {title or 'Unknown Video'}"]
-        output_lines.append(f"**Channel:** {channel or 'Unknown Channel'}")
-        output_lines.append(f"**Enhanced Query:** {enhanced_query}\n")
-        
-        # Handle different return types from Tavily
-        if isinstance(results, str):
-            # If it's already a formatted string
-            output_lines.append("### Search Results")
-            output_lines.append(results)
-        elif isinstance(results, list):
-            # If it's a list of results
-            for index, result in enumerate(results[:4], start=1):
-                output_lines.append(f"### Result {index}")
-                if isinstance(result, dict):
-                    output_lines.append(f"**URL:** {result.get('url', 'N/A')}")
-                    output_lines.append(f"**Title:** {result.get('title', 'N/A')}")
-                    output_lines.append(f"**Summary:** {result.get('content', 'No content available')}")
-                else:
-                    output_lines.append(f"**Content:** {str(result)}")
-        elif isinstance(results, dict):
-            # If it's a single result dict
-            output_lines.append("### Search Result")
-            output_lines.append(f"**URL:** {results.get('url', 'N/A')}")
-            output_lines.append(f"**Title:** {results.get('title', 'N/A')}")
-            output_lines.append(f"**Content:** {results.get('content', 'No content available')}")
-        else:
-            # Fallback for unknown format
-            output_lines.append(f"**Results:** {str(results)}")
-
-        return "\n".join(output_lines)
+        results = await get_tavily().ainvoke(enhanced_query)
+        return _format_search_results(title, channel, enhanced_query, results)
 
     return video_specific_search
 
@@ -127,17 +190,15 @@ def create_retrieve_information_tool(compiled_rag_graph):
         Tool function for RAG retrieval
     """
     @tool
-    def retrieve_information(
+    async def retrieve_information(
         query: Annotated[str, "query to ask the retrieve information tool"]
     ):
         """Use Retrieval Augmented Generation to retrieve information related to user query."""
-        global _retrieved_documents
-
-        result = compiled_rag_graph.invoke({"question": query})
-
-        _retrieved_documents = result['context']
+        result = await compiled_rag_graph.ainvoke({"question": query})
 
-        # Also return dict (though tool will serialize it to string)
+        # Return documents with the response; agent_node_with_docs reads them
+        # from the agent's intermediate steps (the agent serializes the dict
+        # to a string for the model)
         return {
             "response": result['response'],
             "documents": result['context']
@@ -145,11 +206,3 @@ def create_retrieve_information_tool(compiled_rag_graph):
 
     return retrieve_information
 
-
-def get_retrieved_documents():
-    """Get documents retrieved by the last retrieve_information call.
-
-    Returns:
-        List of retrieved documents
-    """
-    return _retrieved_documents
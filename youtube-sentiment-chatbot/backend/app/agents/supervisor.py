@@ -5,74 +5,146 @@ This module provides:
 - Route function binding for supervisor decision-making
 """
 
-from typing import List
+import json
+import weakref
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, List, Tuple
 
+from langchain_core.messages import SystemMessage
 from langchain_core.output_parsers.openai_tools import JsonOutputToolsParser
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from langchain_core.runnables import RunnableLambda
-from langchain_openai import ChatOpenAI
+
+if TYPE_CHECKING:
+    from langchain_openai import ChatOpenAI
 
 from app.core.prompts import SUPERVISOR_ROUTING_QUESTION
 
 
+@lru_cache(maxsize=64)
+def _build_supervisor_prompt(system_prompt: str, members: Tuple[str, ...]) -> ChatPromptTemplate:
+    """Build (and cache) the supervisor prompt template for a team.
 
+    The team members and routing options are substituted once here, so the
+    system messages are static and only the messages placeholder is
+    formatted on each supervisor turn.
+    """
+    options = ["FINISH"] + list(members)
+    return ChatPromptTemplate.from_messages(
+        [
+            SystemMessage(content=system_prompt.format(team_members=", ".join(members))),
+            MessagesPlaceholder(variable_name="messages"),
+            SystemMessage(content=SUPERVISOR_ROUTING_QUESTION.format(options=str(options))),
+        ]
+    )
 
-def create_team_supervisor(llm: ChatOpenAI, system_prompt: str, members: List[str]):
-    """Create an LLM-based router/supervisor for agent teams.
 
-    The supervisor uses OpenAI function calling to decide which team member
-    should act next, or if the task is complete (FINISH).
+def _extract_next(output):
+    """Extract the 'next' field from tool parser output.
 
-    Args:
-        llm: ChatOpenAI instance for the supervisor
-        system_prompt: System instructions for the supervisor
-        members: List of team member names
+    JsonOutputToolsParser returns list of dicts like
+    [{"type": "route", "args": {"next": ["AgentName"]}}]; we need the args of
+    the first tool call.
+    """
+    if isinstance(output, list) and len(output) > 0:
+        return output[0].get("args", {})
+    return output
 
-    Returns:
-        Runnable chain that returns routing decision
+
+# Compact JSON of the route function definition, keyed by the options tuple
+_SCHEMA_CACHE: Dict[Tuple[str, ...], bytes] = {}
+
+
+def _route_function_def(options: Tuple[str, ...]) -> dict:
+    """Return the route function definition for the given options.
+
+    The schema is serialized once per options tuple; each call decodes a
+    fresh copy so bind_tools can never mutate the cached definition.
     """
-    options = ["FINISH"] + members
-
-    function_def = {
-        "name": "route",
-        "description": "Select the next role.",
-        "parameters": {
-            "title": "routeSchema",
-            "type": "object",
-            "properties": {
-                "next": {
-                    "title": "Next",
-                    "anyOf": [
-                        {"enum": options},
-                    ],
+    schema = _SCHEMA_CACHE.get(options)
+    if schema is None:
+        function_def = {
+            "name": "route",
+            "description": "Select the next role.",
+            "parameters": {
+                "title": "routeSchema",
+                "type": "object",
+                "properties": {
+                    "next": {
+                        "title": "Next",
+                        "type": "array",
+                        "items": {"enum": list(options)},
+                    },
                 },
+                "required": ["next"],
             },
-            "required": ["next"],
-        },
-    }
+        }
+        schema = _SCHEMA_CACHE[options] = json.dumps(function_def, separators=(",", ":")).encode()
+    return json.loads(schema)
 
-    prompt = ChatPromptTemplate.from_messages(
-        [
-            ("system", system_prompt),
-            MessagesPlaceholder(variable_name="messages"),
-            (
-                "system",
-               SUPERVISOR_ROUTING_QUESTION
-            ),
-        ]
-    ).partial(options=str(options), team_members=", ".join(members))
 
-    # JsonOutputToolsParser returns list of dicts like [{"type": "route", "args": {"next": "AgentName"}}]
-    # We need to extract the "next" value from the first tool call
-    def extract_next(output):
-        """Extract the 'next' field from tool parser output."""
-        if isinstance(output, list) and len(output) > 0:
-            return output[0].get("args", {})
-        return output
+# LLMs seen by create_team_supervisor, looked up by id() from the chain cache
+_llm_registry: "weakref.WeakValueDictionary[int, ChatOpenAI]" = weakref.WeakValueDictionary()
+
+
+@lru_cache(maxsize=64)
+def _make_supervisor_chain(llm_id: int, system_prompt: str, members: Tuple[str, ...]):
+    """Build (and cache) the bound supervisor chain for an LLM and team.
+
+    The cached chain holds a strong reference to its LLM, so an id cannot be
+    reused by a different instance while its entry is cached.
+    """
+    llm = _llm_registry[llm_id]
+    function_def = _route_function_def(("FINISH",) + members)
+
+    prompt = _build_supervisor_prompt(system_prompt, members)
 
     return (
         prompt
         | llm.bind_tools(tools=[function_def], tool_choice={"type": "function", "function": {"name": "route"}})
         | JsonOutputToolsParser()
-        | RunnableLambda(extract_next)
+        | RunnableLambda(_extract_next)
     )
+
+
+def create_team_supervisor(llm: "ChatOpenAI", system_prompt: str, members: List[str]):
+    """Create an LLM-based router/supervisor for agent teams.
+
+    The supervisor uses OpenAI function calling to decide which team members
+    should act next, or if the task is complete (FINISH). Several members can
+    be selected at once when their work is independent; the graph then runs
+    them in parallel.
+
+    Chains are cached per (llm, system_prompt, members), so rebuilding a
+    supervisor for the same LLM and team reuses the bound runnable.
+
+    Args:
+        llm: ChatOpenAI instance for the supervisor
+        system_prompt: System instructions for the supervisor
+        members: List of team member names
+
+    Returns:
+        Runnable chain that returns routing decision
+    """
+    _llm_registry[id(llm)] = llm
+    return _make_supervisor_chain(id(llm), system_prompt, tuple(members))
+
+
+def route_next(state) -> List[str]:
+    """Conditional-edge function returning the members selected by a supervisor.
+
+    Returning a list lets LangGraph fan out to every selected member in the
+    same step. FINISH wins over any other selection.
+
+    Args:
+        state: Graph state containing the supervisor's "next" decision
+
+    Returns:
+        List of member names to run next, or ["FINISH"]
+    """
+    next_members = state["next"]
+    if isinstance(next_members, str):
+        next_members = [next_members]
+    if not next_members or "FINISH" in next_members:
+        return ["FINISH"]
+    return list(dict.fromkeys(next_members))
@@ -3,11 +3,12 @@
 This module defines request and response models for:
 - Video analysis endpoint
 - Query endpoint
+- Batch query endpoint
 - Streaming responses
 """
 
 from typing import Optional, List, Dict, Any, Literal
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl
 
 
 class VideoAnalysisRequest(BaseModel):
@@ -56,6 +57,31 @@ class QueryRequest(BaseModel):
     )
 
 
+class BatchQueryRequest(BaseModel):
+    """Request model for answering several questions about an analyzed video.
+
+    Questions are answered independently by the session's RAG graph and
+    are not added to the conversation thread.
+    """
+
+    session_id: str = Field(
+        ...,
+        description="Session ID (thread_id) from a previous analysis",
+        examples=["a1b2c3d4-e5f6-7890-abcd-ef1234567890"]
+    )
+
+    questions: List[str] = Field(
+        ...,
+        description="Questions to answer from the video's comments",
+        min_length=1,
+        max_length=32,
+        examples=[[
+            "What do viewers like most about this video?",
+            "What do viewers criticize?"
+        ]]
+    )
+
+
 class DocumentMetadata(BaseModel):
     """Document metadata model."""
 
@@ -74,12 +100,33 @@ class RetrievedDocument(BaseModel):
     metadata: Dict[str, Any]
 
 
+class BatchAnswer(BaseModel):
+    """Answer to one question of a batch query."""
+
+    question: str
+    response: str
+    documents: List[RetrievedDocument] = Field(default_factory=list)
+
+
+class BatchQueryResponse(BaseModel):
+    """Response model for the batch query endpoint."""
+
+    session_id: str
+    answers: List[BatchAnswer]
+
+
 class StreamEvent(BaseModel):
-    """Base model for streaming events."""
+    """Base model for streaming events.
+
+    Events are immutable; internally generated events may be built with
+    model_construct() on hot streaming paths to skip validation.
+    """
+
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     type: str = Field(
         ...,
-        description="Event type: progress, agent_message, final, error"
+        description="Event type: progress, agent_message, final_start, final_doc, final_end, error"
     )
 
     content: str = Field(
@@ -93,6 +140,10 @@ class AgentMessageEvent(StreamEvent):
 
     type: Literal["agent_message"] = "agent_message"
     agent: str = Field(..., description="Agent name")
+    chunk: bool = Field(
+        default=False,
+        description="True for incremental token deltas, False for complete messages"
+    )
 
 
 class ProgressEvent(StreamEvent):
@@ -101,14 +152,25 @@ class ProgressEvent(StreamEvent):
     type: Literal["progress"] = "progress"
 
 
-class FinalResponseEvent(StreamEvent):
-    """Streaming event for final response."""
+class FinalStartEvent(StreamEvent):
+    """Streaming event opening the final response."""
 
-    type: Literal["final"] = "final"
-    documents: Optional[List[RetrievedDocument]] = Field(
-        default=None,
-        description="Retrieved documents used in response"
-    )
+    type: Literal["final_start"] = "final_start"
+    content: str = ""
+
+
+class FinalDocumentEvent(StreamEvent):
+    """Streaming event carrying one retrieved document of the final response."""
+
+    type: Literal["final_doc"] = "final_doc"
+    content: str = ""
+    doc: RetrievedDocument = Field(..., description="Retrieved document used in response")
+
+
+class FinalEndEvent(StreamEvent):
+    """Streaming event closing the final response with its content."""
+
+    type: Literal["final_end"] = "final_end"
 
 
 class ErrorEvent(StreamEvent):
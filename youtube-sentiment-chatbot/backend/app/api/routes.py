@@ -3,6 +3,7 @@
 This module provides endpoints for:
 - Video analysis with streaming responses and memory persistence
 - Follow-up questions within the same conversation thread
+- Batched independent questions about an analyzed video
 - Health check
 
 Memory Management:
@@ -11,227 +12,593 @@ Memory Management:
 - Follow-up questions reuse the same graph and memory
 """
 
-import json
 import asyncio
-from typing import AsyncGenerator, Optional
+import logging
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, AsyncGenerator, Dict, Optional
+
+import orjson
 from fastapi import APIRouter, HTTPException
-from fastapi.responses import StreamingResponse
-from langchain_core.messages import HumanMessage
+from fastapi.responses import Response, StreamingResponse
+from langchain_core.documents import Document
+from langchain_core.messages import AIMessage, HumanMessage
+from langgraph.graph import START
 from langchain_openai import ChatOpenAI
 
 from app.api.models import (
     VideoAnalysisRequest,
     QueryRequest,
+    BatchQueryRequest,
+    BatchAnswer,
+    BatchQueryResponse,
+    RetrievedDocument,
     HealthResponse
 )
 from app.core.configuration import default_config
+from app.core.prompts import AGENT_PROMPTS
 from app.core.session_manager import session_manager
 from app.utils.helpers import (
     extract_video_id,
     format_progress_message,
-    format_final_response,
+    format_final_start,
+    format_final_document,
+    format_final_end,
     format_error_message
 )
+from app.youtube.collectors import is_transient_error
 from app.youtube.document_builder import create_unified_video_document
-from app.rag.chunking import prepare_documents_for_retrieval
+from app.rag.chunking import document_cache_key, prepare_documents_for_retrieval
 from app.rag.retrieval import create_bm25_retriever
 from app.rag.generation import create_generator_llm
-from app.graphs.rag_graph import build_rag_graph
+from app.graphs.rag_graph import batch_answer, build_rag_graph
 from app.graphs.research_graph import build_research_graph, create_research_chain
 from app.graphs.analysis_graph import build_analysis_graph, create_analysis_chain
-from app.graphs.main_graph import build_main_graph
+from app.graphs.main_graph import build_main_graph, summarize_conversation_memory
 from app.agents.research_tools import (
     create_video_specific_search_tool,
     create_retrieve_information_tool
 )
 
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
+# Model names are fixed at import time; bind them once for the session path
+_GENERATOR_MODEL = default_config.generator_model
+_RESEARCH_MODEL = default_config.research_model
+_ANALYSIS_MODEL = default_config.analysis_model
+_SUPERVISOR_MODEL = default_config.supervisor_model
+
+# Seconds of silence before a keep-alive comment is sent on an event stream
+SSE_PING_INTERVAL = 15
+_SSE_PING = b": ping\n\n"
+
+# Stop reverse proxies (nginx, Cloudflare) from buffering event streams
+_SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+# Static liveness payload, serialized once so probes skip validation and encoding
+_HEALTH_BODY = orjson.dumps(HealthResponse(status="healthy", version="1.0.0").model_dump())
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize types orjson does not handle natively."""
+    if isinstance(obj, Document):
+        return {"content": obj.page_content, "metadata": obj.metadata}
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+# Video retrieval stacks kept per (video_id, max_comments); entries expire
+# so refetches pick up new comments within the collector cache TTLs
+VIDEO_INDEX_CACHE_SIZE = 32
+VIDEO_INDEX_TTL = 60 * 60
+_video_index_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+_video_index_cache_lock = threading.Lock()
+
+
+def _load_video_index(video_id: str, max_comments: int) -> tuple:
+    """Fetch a video and build its retrieval stack, shared across sessions.
+
+    BM25 tokenization and the compiled RAG graph depend only on the video and
+    comment budget, so repeat analyses of the same video reuse them for up to
+    VIDEO_INDEX_TTL seconds. Only the per-session main graph (which owns the
+    checkpointer) is rebuilt. Stacks built while a YouTube source failed
+    transiently (quota, network) are not cached, so the next analysis
+    retries the fetch. Once a video falls out of this cache, chunking and
+    BM25 indexing are still cached by content, so refetching an unchanged
+    video skips them.
+
+    Args:
+        video_id: YouTube video ID
+        max_comments: Maximum number of comments to collect
+
+    Returns:
+        Tuple of (unified_document, transcript, docs_for_store, comment_count,
+        bm25_retriever, compiled_rag_graph). Only the transcript is kept from
+        the raw API blobs; comments already live in docs_for_store.
+    """
+    key = (video_id, max_comments)
+    now = time.monotonic()
+    with _video_index_cache_lock:
+        cached = _video_index_cache.get(key)
+        if cached is not None:
+            expires_at, index = cached
+            if expires_at > now:
+                _video_index_cache.move_to_end(key)
+                return index
+            del _video_index_cache[key]
+
+    index, cacheable = _build_video_index(video_id, max_comments)
+
+    if cacheable:
+        with _video_index_cache_lock:
+            _video_index_cache[key] = (now + VIDEO_INDEX_TTL, index)
+            _video_index_cache.move_to_end(key)
+            while len(_video_index_cache) > VIDEO_INDEX_CACHE_SIZE:
+                _video_index_cache.popitem(last=False)
+    return index
+
+
+def _build_video_index(video_id: str, max_comments: int) -> tuple:
+    """Build a video's retrieval stack (uncached).
+
+    Args:
+        video_id: YouTube video ID
+        max_comments: Maximum number of comments to collect
+
+    Returns:
+        Tuple of (index, cacheable): the _load_video_index tuple, and whether
+        every source response was free of transient errors
+    """
+    unified_document, raw_blobs = create_unified_video_document(
+        video_id, max_comments, return_raw=True
+    )
+    cacheable = not any(
+        is_transient_error(raw_blobs[source])
+        for source in ("video_details", "comments", "transcript")
+    )
+
+    _, comment_docs, docs_for_store = prepare_documents_for_retrieval(
+        unified_document,
+        raw_blobs["formatted_comments"]
+    )
+
+    bm25_retriever = create_bm25_retriever(
+        docs_for_store,
+        cache_key=document_cache_key(unified_document, raw_blobs["formatted_comments"])
+    )
+    generator_llm = create_generator_llm(_GENERATOR_MODEL)
+    compiled_rag_graph = build_rag_graph(bm25_retriever, generator_llm)
+
+    index = (
+        unified_document,
+        raw_blobs["transcript"].get("transcript", ""),
+        docs_for_store,
+        len(comment_docs),
+        bm25_retriever,
+        compiled_rag_graph,
+    )
+    return index, cacheable
+
+
+@lru_cache(maxsize=8)
+def _chat(model: str) -> ChatOpenAI:
+    """Return the shared ChatOpenAI client for a model.
+
+    One client per model name keeps a single HTTP connection pool alive
+    across graphs and sessions instead of opening new ones per analysis.
+    """
+    return ChatOpenAI(model=model)
 
-async def analyze_video_stream(
+
+@lru_cache(maxsize=1)
+def _analysis_chain():
+    """Return the shared Analysis Team chain.
+
+    The Analysis Team depends only on the analysis LLM, not on the video,
+    so it is compiled once and reused by every session's main graph.
+    """
+    return create_analysis_chain(build_analysis_graph(_chat(_ANALYSIS_MODEL)))
+
+
+def warm_up():
+    """Build the shared LLM clients and video-independent graphs.
+
+    Called at app startup so the first analysis does not pay for client
+    creation or Analysis Team compilation.
+    """
+    for model in (_GENERATOR_MODEL, _RESEARCH_MODEL, _ANALYSIS_MODEL, _SUPERVISOR_MODEL):
+        _chat(model)
+    _analysis_chain()
+
+
+def _build_agent_system(title: str, channel: str, transcript: str, compiled_rag_graph):
+    """Build the per-session multi-agent graph with its memory checkpointer.
+
+    Tool creation summarizes the transcript synchronously, so callers run
+    this off the event loop.
+
+    Args:
+        title: Video title
+        channel: Channel name
+        transcript: Raw transcript text
+        compiled_rag_graph: Compiled RAG graph backing comment retrieval
+
+    Returns:
+        Compiled main graph with memory checkpointing
+    """
+    # Shared LLM clients for agents
+    research_llm = _chat(_RESEARCH_MODEL)
+    super_llm = _chat(_SUPERVISOR_MODEL)
+
+    # Create tools
+    video_specific_search_tool = create_video_specific_search_tool(title, channel, transcript)
+    retrieve_information_tool = create_retrieve_information_tool(compiled_rag_graph)
+
+    # Build graphs
+    compiled_research_graph = build_research_graph(
+        research_llm,
+        video_specific_search_tool,
+        retrieve_information_tool
+    )
+
+    # Create chains (the Analysis Team is video-independent and shared)
+    research_chain = create_research_chain(compiled_research_graph)
+
+    # Build main graph with memory checkpointer
+    return build_main_graph(super_llm, research_chain, _analysis_chain())
+
+
+def _emit(obj: dict) -> bytes:
+    """Encode one streaming event as a Server-Sent Events frame."""
+    data = orjson.dumps(obj, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+    return b"event: " + obj["type"].encode() + b"\ndata: " + data + b"\n\n"
+
+
+# Agent nodes whose LLM tokens are streamed as agent_message chunks
+_STREAMING_AGENTS = frozenset(AGENT_PROMPTS)
+
+# Static stream frames, encoded once at import time
+_ERROR_SESSION_NOT_FOUND = _emit(format_error_message("Session not found or expired. Please start a new analysis."))
+_ERROR_INVALID_VIDEO = _emit(format_error_message("Invalid YouTube URL or video ID"))
+_PROGRESS_FETCHING = _emit(format_progress_message("Fetching video data, comments, and transcript..."))
+_PROGRESS_INITIALIZING = _emit(format_progress_message("Initializing multi-agent system with memory..."))
+_PROGRESS_STARTING = _emit(format_progress_message("Starting analysis..."))
+_ERROR_NO_RESPONSE = _emit(format_error_message("No response generated"))
+
+
+async def _with_keepalive(
+    events: AsyncGenerator[bytes, None],
+    interval: float = SSE_PING_INTERVAL
+) -> AsyncGenerator[bytes, None]:
+    """Interleave SSE comment pings whenever the wrapped stream is idle.
+
+    The wrapped generator runs in a single producer task, so long LLM calls
+    never leave the connection silent for longer than ``interval`` seconds.
+
+    Args:
+        events: Stream of already-encoded SSE frames
+        interval: Seconds of silence before a ping is sent
+
+    Yields:
+        SSE frames from ``events`` plus keep-alive comments
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+
+    async def pump():
+        try:
+            async for chunk in events:
+                await queue.put(chunk)
+        finally:
+            await queue.put(None)
+
+    producer = asyncio.create_task(pump())
+    try:
+        while True:
+            try:
+                chunk = await asyncio.wait_for(queue.get(), interval)
+            except asyncio.TimeoutError:
+                yield _SSE_PING
+                continue
+            if chunk is None:
+                break
+            yield chunk
+        await producer
+    finally:
+        producer.cancel()
+
+
+def _event_stream_response(events: AsyncGenerator[bytes, None]) -> StreamingResponse:
+    """Wrap an SSE frame generator in an unbuffered, keep-alive streaming response."""
+    return StreamingResponse(
+        _with_keepalive(events),
+        media_type="text/event-stream",
+        headers=_SSE_HEADERS
+    )
+
+
+# Conversation summaries running after a response, by session ID
+_pending_summaries: Dict[str, asyncio.Task] = {}
+
+
+async def _summarize_in_background(main_graph, session_id: str, config: dict) -> None:
+    """Compact a thread's memory, logging rather than raising failures."""
+    try:
+        await summarize_conversation_memory(main_graph, config)
+    except Exception:  # noqa: BLE001
+        logger.exception("Conversation summary failed for session %s", session_id)
+    finally:
+        if _pending_summaries.get(session_id) is asyncio.current_task():
+            del _pending_summaries[session_id]
+
+
+def _schedule_memory_summary(main_graph, session_id: str, config: dict) -> None:
+    """Summarize a thread off the response path, once its answer is out."""
+    _pending_summaries[session_id] = asyncio.create_task(
+        _summarize_in_background(main_graph, session_id, config)
+    )
+
+
+async def _wait_for_memory_summary(session_id: str) -> None:
+    """Let a pending summary of the thread finish before it is updated again."""
+    task = _pending_summaries.get(session_id)
+    if task is not None:
+        await task
+
+
+async def _stream_graph_run(
+    main_graph,
+    session_id: str,
+    graph_input: Optional[dict],
+    config: dict
+) -> AsyncGenerator[bytes, None]:
+    """Run the main graph once and stream agent messages and the final answer.
+
+    Args:
+        main_graph: Compiled main graph with memory checkpointer
+        session_id: Session ID (thread_id) of the conversation
+        graph_input: Graph input, or None to resume a prepared thread
+        config: Run config carrying the thread_id and recursion limit
+
+    Yields:
+        Server-Sent Events frames (bytes) with JSON data
+    """
+    # Agent message template reused for every streamed update; only the
+    # per-event fields are reassigned before serialization
+    agent_metadata = {"agent_name": None, "langgraph_node": None}
+    agent_event = {
+        "type": "agent_message",
+        "agent": None,
+        "content": None,
+        "session_id": session_id,
+        "metadata": agent_metadata
+    }
+    token_event = {
+        "type": "agent_message",
+        "agent": None,
+        "content": None,
+        "chunk": True,
+        "session_id": session_id
+    }
+
+    # Execute graph once, streaming agent tokens and node updates and
+    # tracking the accumulated state so the final answer needs no second run
+    final_state = None
+    async for namespace, mode, event in main_graph.astream(
+        graph_input,
+        config,
+        stream_mode=["messages", "updates", "values"],
+        subgraphs=True,
+        # Checkpoint the thread once when the run ends instead of after
+        # every supervisor and team step
+        durability="exit"
+    ):
+        if mode == "messages":
+            # Token deltas from agent LLM calls inside the team subgraphs;
+            # supervisor routing calls (tool-call only), RAG generation
+            # inside tools and node outputs are skipped
+            message_chunk, metadata = event
+            agent_name = metadata.get("langgraph_node")
+            content = message_chunk.content
+            if (
+                agent_name in _STREAMING_AGENTS
+                and isinstance(message_chunk, AIMessage)
+                and content
+                and isinstance(content, str)
+            ):
+                token_event["agent"] = agent_name
+                token_event["content"] = content
+                yield _emit(token_event)
+            continue
+
+        # Team subgraph updates and states are covered by the main graph's
+        if namespace:
+            continue
+
+        if mode == "values":
+            final_state = event
+            continue
+
+        # Skip end event
+        if "__end__" in event:
+            continue
+
+        # Extract node name and state
+        for node_name, state_update in event.items():
+            # Yield progress for each node execution: one event per agent
+            # answer, as a team forwards every member's message
+            if state_update and state_update.get("messages"):
+                for message in state_update["messages"]:
+                    # Extract agent name from message
+                    agent_name = getattr(message, "name", None) or node_name
+
+                    agent_event["agent"] = agent_name
+                    agent_event["content"] = message.content
+                    agent_metadata["agent_name"] = agent_name
+                    agent_metadata["langgraph_node"] = node_name
+                    yield _emit(agent_event)
+
+    # Step 8: Format response from the last streamed state
+    if final_state and final_state.get("final_answer"):
+        final_content = final_state["final_answer"]
+        final_documents = final_state.get("documents", [])
+
+        # Stream documents one frame at a time rather than one large blob
+        yield _emit(format_final_start())
+        for doc in final_documents:
+            yield _emit(format_final_document(doc))
+
+        final_end = format_final_end(final_content)
+        final_end["session_id"] = session_id
+        yield _emit(final_end)
+
+        # Compact older turns in the background once the answer is out, so
+        # follow-ups in this thread start from a bounded history; a summary
+        # failure is logged and never reaches this already-answered stream
+        _schedule_memory_summary(main_graph, session_id, config)
+    else:
+        yield _ERROR_NO_RESPONSE
+
+
+
+async def stream_new_analysis(
     url: str,
     max_comments: int,
-    question: str,
-    session_id: Optional[str] = None
-) -> AsyncGenerator[str, None]:
-    """Stream video analysis progress and results with conversation memory.
+    question: str
+) -> AsyncGenerator[bytes, None]:
+    """Stream a first analysis of a video, creating a new session.
 
-    This function handles both initial analyses and follow-up questions:
-    - If session_id is None: Creates new session, builds full graph
-    - If session_id provided: Reuses existing session with cached data
+    Fetches the video, builds the multi-agent graph with a memory
+    checkpointer and registers it under a new session ID (thread_id).
 
     Args:
-        url: YouTube URL or video ID (required for new sessions)
+        url: YouTube URL or video ID
         max_comments: Maximum number of comments to fetch
-        question: Question to ask (initial or follow-up)
-        session_id: Optional session ID for follow-up questions
+        question: Initial question to ask
 
     Yields:
-        JSON-encoded streaming events including session_id
+        Server-Sent Events frames (bytes) with JSON data, including session_id
     """
     try:
-        # Check if this is a follow-up question
-        if session_id:
-            yield json.dumps(format_progress_message(f"Continuing conversation in session: {session_id[:8]}...")) + "\n"
-            
-            session = session_manager.get_session(session_id)
-            if not session or not session.main_graph:
-                yield json.dumps(format_error_message("Session not found or expired. Please start a new analysis.")) + "\n"
-                return
-            
-            yield json.dumps(format_progress_message(f"Using cached data for: {session.video_title}")) + "\n"
-            
-            # Use existing graph with memory
-            main_graph = session.main_graph
-            video_id = session.video_id
-        else:
-            # Step 1: Extract video ID for new session
-            video_id = extract_video_id(url)
-            if not video_id:
-                yield json.dumps(format_error_message("Invalid YouTube URL or video ID")) + "\n"
-                return
-
-            yield json.dumps(format_progress_message(f"Analyzing video: {video_id}")) + "\n"
-
-            # Step 2: Fetch YouTube data
-            yield json.dumps(format_progress_message("Fetching video data, comments, and transcript...")) + "\n"
-
-            unified_document, raw_blobs = create_unified_video_document(video_id, max_comments)
-
-            title = unified_document.metadata.get("title", "Unknown")
-            channel = unified_document.metadata.get("channel", "Unknown")
-
-            yield json.dumps(format_progress_message(f"Video: {title} by {channel}")) + "\n"
-
-            # Step 3: Create session
-            new_session_id = session_manager.create_session(video_id, title, channel)
-            session_id = new_session_id
-            
-            yield json.dumps({
-                "type": "session_created",
-                "session_id": session_id,
-                "video_id": video_id,
-                "title": title,
-                "channel": channel
-            }) + "\n"
-
-            # Step 4: Prepare documents for BM25 retrieval
-            yield json.dumps(format_progress_message("Preparing documents for retrieval...")) + "\n"
-
-            context_doc, comment_docs, docs_for_store = prepare_documents_for_retrieval(
-                unified_document,
-                raw_blobs["formatted_comments"]
-            )
+        # Step 1: Extract video ID for new session
+        video_id = extract_video_id(url)
+        if not video_id:
+            yield _ERROR_INVALID_VIDEO
+            return
+
+        yield _emit(format_progress_message(f"Analyzing video: {video_id}"))
+
+        # Step 2: Fetch YouTube data
+        yield _PROGRESS_FETCHING
+
+        # Steps 2, 4 and 5 are cached per (video_id, max_comments):
+        # fetch data, prepare documents, build BM25 retriever and RAG graph.
+        # Run in a worker thread so ingest does not block other connections
+        (
+            unified_document,
+            transcript,
+            docs_for_store,
+            comment_count,
+            bm25_retriever,
+            compiled_rag_graph,
+        ) = await asyncio.to_thread(_load_video_index, video_id, max_comments)
+
+        title = unified_document.metadata.get("title", "Unknown")
+        channel = unified_document.metadata.get("channel", "Unknown")
+
+        yield _emit(format_progress_message(f"Video: {title} by {channel}"))
+
+        # Step 3: Create session
+        session_id = session_manager.create_session(video_id, title, channel)
+
+        yield _emit({
+            "type": "session_created",
+            "session_id": session_id,
+            "video_id": video_id,
+            "title": title,
+            "channel": channel
+        })
+
+        yield _emit(format_progress_message(
+            f"Prepared {len(docs_for_store)} documents ({comment_count} comments)"
+        ))
+
+        # Step 6: Build multi-agent system with memory
+        yield _PROGRESS_INITIALIZING
+
+        main_graph = await asyncio.to_thread(
+            _build_agent_system, title, channel, transcript, compiled_rag_graph
+        )
 
-            yield json.dumps(format_progress_message(
-                f"Prepared {len(docs_for_store)} documents ({len(comment_docs)} comments)"
-            )) + "\n"
+        # Update session with artifacts
+        session_manager.update_session(
+            session_id,
+            main_graph=main_graph,
+            documents=docs_for_store,
+            bm25_retriever=bm25_retriever,
+            rag_graph=compiled_rag_graph
+        )
 
-            # Step 5: Build BM25 retriever and RAG graph
-            yield json.dumps(format_progress_message("Building retrieval system...")) + "\n"
+        # Step 7: Stream graph execution with the session's thread config
+        yield _PROGRESS_STARTING
 
-            bm25_retriever = create_bm25_retriever(docs_for_store)
-            generator_llm = create_generator_llm(default_config.generator_model)
+        session = session_manager.get_session(session_id)
+        graph_input = {"messages": [HumanMessage(content=question)]}
 
-            compiled_rag_graph = build_rag_graph(bm25_retriever, generator_llm)
+        async for frame in _stream_graph_run(main_graph, session_id, graph_input, session.config):
+            yield frame
 
-            # Step 6: Build multi-agent system with memory
-            yield json.dumps(format_progress_message("Initializing multi-agent system with memory...")) + "\n"
+    except Exception as e:
+        yield _emit(format_error_message(f"Error during analysis: {str(e)}"))
 
-            # Create LLMs for agents
-            research_llm = ChatOpenAI(model=default_config.research_model)
-            analysis_llm = ChatOpenAI(model=default_config.analysis_model)
-            super_llm = ChatOpenAI(model=default_config.supervisor_model)
 
-            # Create tools
-            transcript = raw_blobs["transcript"].get("transcript", "")
-            video_specific_search_tool = create_video_specific_search_tool(title, channel, transcript)
-            retrieve_information_tool = create_retrieve_information_tool(compiled_rag_graph)
+async def stream_followup(session_id: str, question: str) -> AsyncGenerator[bytes, None]:
+    """Stream the answer to a follow-up question in an existing session.
 
-            # Build graphs
-            compiled_research_graph = build_research_graph(
-                research_llm,
-                video_specific_search_tool,
-                retrieve_information_tool
-            )
+    Reuses the session's graph and cached data; conversation history comes
+    from the session's checkpointed thread.
 
-            compiled_analysis_graph = build_analysis_graph(analysis_llm)
-
-            # Create chains
-            research_chain = create_research_chain(compiled_research_graph)
-            analysis_chain = create_analysis_chain(compiled_analysis_graph)
-
-            # Build main graph with memory checkpointer
-            main_graph = build_main_graph(super_llm, research_chain, analysis_chain)
-            
-            # Update session with artifacts
-            session_manager.update_session(
-                session_id,
-                main_graph=main_graph,
-                documents=docs_for_store,
-                bm25_retriever=bm25_retriever,
-                raw_blobs=raw_blobs
-            )
+    Args:
+        session_id: Session ID (thread_id) from a previous analysis
+        question: Follow-up question
 
-        # Step 7: Stream graph execution with thread_id for memory
-        yield json.dumps(format_progress_message("Starting analysis...")) + "\n"
+    Yields:
+        Server-Sent Events frames (bytes) with JSON data, including session_id
+    """
+    try:
+        yield _emit(format_progress_message(f"Continuing conversation in session: {session_id[:8]}..."))
 
-        initial_state = {
-            "messages": [HumanMessage(content=question)]
-        }
+        session = session_manager.get_session(session_id)
+        if not session or not session.main_graph:
+            yield _ERROR_SESSION_NOT_FOUND
+            return
 
-        # Use thread_id (session_id) for conversation memory
-        config = {"configurable": {"thread_id": session_id}}
+        yield _emit(format_progress_message(f"Using cached data for: {session.video_title}"))
 
-        # Execute graph with streaming
-        async for event in main_graph.astream(
-            initial_state,
-            config
-        ):
-            # Skip end event
-            if "__end__" in event:
-                continue
+        main_graph = session.main_graph
 
-            # Extract node name and state
-            for node_name, state_update in event.items():
-                # Yield progress for each node execution
-                if "messages" in state_update and state_update["messages"]:
-                    last_message = state_update["messages"][-1]
+        yield _PROGRESS_STARTING
 
-                    # Extract agent name from message
-                    agent_name = getattr(last_message, "name", node_name)
-                    content = last_message.content
-
-                    yield json.dumps({
-                        "type": "agent_message",
-                        "agent": agent_name,
-                        "content": content,
-                        "session_id": session_id,
-                        "metadata": {
-                            "agent_name": agent_name,
-                            "langgraph_node": node_name
-                        }
-                    }) + "\n"
-
-        # Step 8: Get final state and format response
-        final_state = await main_graph.ainvoke(
-            initial_state,
-            config
-        )
+        # A summary still compacting this thread must land before the new
+        # question is appended
+        await _wait_for_memory_summary(session_id)
 
-        if final_state and "messages" in final_state and final_state["messages"]:
-            final_content = final_state["messages"][-1].content
-            final_documents = final_state.get("documents", [])
+        # Append only the new question to the checkpointed thread and
+        # resume from the entry point instead of passing graph input
+        await main_graph.aupdate_state(
+            session.config,
+            {"messages": [HumanMessage(content=question)]},
+            as_node=START
+        )
 
-            response = format_final_response(final_content, final_documents)
-            response["session_id"] = session_id
-            yield json.dumps(response) + "\n"
-        else:
-            yield json.dumps(format_error_message("No response generated")) + "\n"
+        async for frame in _stream_graph_run(main_graph, session_id, None, session.config):
+            yield frame
 
     except Exception as e:
-        yield json.dumps(format_error_message(f"Error during analysis: {str(e)}")) + "\n"
+        yield _emit(format_error_message(f"Error during analysis: {str(e)}"))
 
 
 @router.post("/analyze")
@@ -252,16 +619,14 @@ async def analyze_video(request: VideoAnalysisRequest):
         request: Video analysis request with URL and parameters
 
     Returns:
-        StreamingResponse with JSON events including session_id
+        Server-Sent Events stream of JSON events including session_id
     """
-    return StreamingResponse(
-        analyze_video_stream(
+    return _event_stream_response(
+        stream_new_analysis(
             request.url,
             request.max_comments,
-            request.question or "What is the overall sentiment of the comments on this video?",
-            None  # New session
-        ),
-        media_type="text/event-stream"
+            request.question or "What is the overall sentiment of the comments on this video?"
+        )
     )
 
 
@@ -283,7 +648,7 @@ async def query_video(request: QueryRequest):
         request: Query request with session_id and question
 
     Returns:
-        StreamingResponse with JSON events
+        Server-Sent Events stream of JSON events
     """
     if not request.session_id:
         raise HTTPException(
@@ -291,14 +656,48 @@ async def query_video(request: QueryRequest):
             detail="session_id is required for follow-up questions"
         )
     
-    return StreamingResponse(
-        analyze_video_stream(
-            "",  # URL not needed for follow-up
-            50,  # max_comments not needed for follow-up
-            request.question,
-            request.session_id  # Existing session
-        ),
-        media_type="text/event-stream"
+    return _event_stream_response(
+        stream_followup(request.session_id, request.question)
+    )
+
+
+@router.post("/query/batch", response_model=BatchQueryResponse)
+async def batch_query_video(request: BatchQueryRequest):
+    """Answer several independent questions about an analyzed video.
+
+    Each question goes straight to the session's RAG graph (BM25 retrieval
+    over the comments plus generation), and all of them run in one abatch
+    call so their LLM round-trips overlap. Unlike /query, answers are not
+    added to the conversation thread.
+
+    Args:
+        request: Batch query request with session_id and questions
+
+    Returns:
+        One answer with its retrieved documents per question, in order
+    """
+    session = session_manager.get_session(request.session_id)
+    if not session or not session.rag_graph:
+        raise HTTPException(
+            status_code=404,
+            detail="Session not found or expired. Please start a new analysis."
+        )
+
+    results = await batch_answer(session.rag_graph, request.questions)
+
+    return BatchQueryResponse(
+        session_id=request.session_id,
+        answers=[
+            BatchAnswer(
+                question=result["question"],
+                response=result["response"],
+                documents=[
+                    RetrievedDocument(content=doc.page_content, metadata=doc.metadata)
+                    for doc in result["context"]
+                ]
+            )
+            for result in results
+        ]
     )
 
 
@@ -309,4 +708,4 @@ async def health_check():
     Returns:
         Health status and version
     """
-    return HealthResponse(status="healthy", version="1.0.0")
+    return Response(content=_HEALTH_BODY, media_type="application/json")
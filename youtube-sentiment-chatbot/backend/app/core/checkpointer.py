@@ -0,0 +1,64 @@
+"""Checkpointer management for conversation memory.
+
+This module provides the process-wide LangGraph checkpointer shared by all
+session graphs:
+- AsyncSqliteSaver (WAL mode) when a checkpoint database path is configured,
+  so threads survive restarts and can be shared across workers
+- MemorySaver otherwise, for local development
+
+Thread IDs are unique per session, so a single saver serves every graph.
+"""
+
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.checkpoint.memory import MemorySaver
+
+_checkpointer: Optional[BaseCheckpointSaver] = None
+
+
+@asynccontextmanager
+async def open_checkpointer(db_path: Optional[str]) -> AsyncIterator[BaseCheckpointSaver]:
+    """Open the shared checkpointer for the lifetime of the app.
+
+    Args:
+        db_path: SQLite database path, or None for in-memory checkpoints
+
+    Yields:
+        The checkpointer returned by get_checkpointer() while open
+    """
+    global _checkpointer
+
+    if not db_path:
+        _checkpointer = MemorySaver()
+        try:
+            yield _checkpointer
+        finally:
+            _checkpointer = None
+        return
+
+    from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+
+    async with AsyncSqliteSaver.from_conn_string(db_path) as saver:
+        # WAL lets several workers read while one writes
+        await saver.conn.execute("PRAGMA journal_mode=WAL")
+        _checkpointer = saver
+        try:
+            yield saver
+        finally:
+            _checkpointer = None
+
+
+def get_checkpointer() -> BaseCheckpointSaver:
+    """Return the shared checkpointer.
+
+    Outside the app lifespan (e.g. scripts), a new MemorySaver is returned
+    so graphs can still be built and run.
+
+    Returns:
+        Checkpointer to compile session graphs with
+    """
+    if _checkpointer is None:
+        return MemorySaver()
+    return _checkpointer
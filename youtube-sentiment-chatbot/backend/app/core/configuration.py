@@ -48,21 +48,47 @@ class Configuration(BaseModel):
         description="Model for transcript summarization"
     )
 
+    llm_cache_size: int = Field(
+        default=1000,
+        description="Maximum number of LLM responses kept in the in-memory LLM cache"
+    )
+
+    # Memory Configuration
+    memory_max_messages: int = Field(
+        default=20,
+        description="Messages kept verbatim per thread before older turns are summarized"
+    )
+
+    memory_summary_margin: int = Field(
+        default=10,
+        description="Messages a thread may grow past memory_max_messages before it is summarized"
+    )
+
+    checkpoint_db: Optional[str] = Field(
+        default_factory=lambda: os.getenv("CHECKPOINT_DB"),
+        description="SQLite path for durable conversation checkpoints (in-memory if unset)"
+    )
+
     # YouTube Configuration
     max_comments: int = Field(
         default=50,
         description="Maximum number of comments to fetch from YouTube"
     )
 
+    youtube_cache_dir: str = Field(
+        default_factory=lambda: os.getenv("YOUTUBE_CACHE_DIR", ".cache/youtube"),
+        description="Directory of the disk cache for YouTube API responses (empty disables it)"
+    )
+
     # RAG Configuration
     chunk_size: int = Field(
         default=750,
-        description="Chunk size for RecursiveCharacterTextSplitter"
+        description="Chunk size for the transcript splitter"
     )
 
     chunk_overlap: int = Field(
         default=150,
-        description="Chunk overlap for RecursiveCharacterTextSplitter"
+        description="Chunk overlap for the transcript splitter"
     )
 
     # Graph Configuration
@@ -4,8 +4,11 @@ This module contains prompts for:
 - Research team agents (VideoSearch, CommentFinder)
 - Analysis team agents (Sentiment, Topic)
 - Team supervisors (Research, Analysis, Super)
+- Conversation memory summarization
 """
 
+from typing import Final
+
 # ============================================================================
 # RESEARCH TEAM AGENT PROMPTS
 # ============================================================================
@@ -47,7 +50,7 @@ CommentFinder: Use for internal video data (comments, transcript, video details)
 You should never ask your team to do anything beyond research. They are not required to write content or posts. You should only pass tasks to workers that are specifically research focused. When finished, respond with FINISH."""
 
 
-ANALYSIS_SUPERVISOR_PROMPT = """You are a supervisor tasked with managing a conversation between the following workers: {team_members}. You should always verify the analysis contents after any decision is been made. Given the following user request, respond with the worker to act next. Each worker will perform a task and respond with their results and status. When each team is finished, you must respond with FINISH."""
+ANALYSIS_SUPERVISOR_PROMPT = """You are a supervisor tasked with managing a conversation between the following workers: {team_members}. Both workers have already run in parallel on the same retrieved comments and their results are in the conversation. You should always verify the analysis contents. If an analysis is missing or incomplete for the user request, respond with the worker(s) to act again; select several together to run them in parallel. Each worker will perform a task and respond with their results and status. When the analyses answer the request, you must respond with FINISH."""
 
 
 SUPER_SUPERVISOR_PROMPT = """You are the master supervisor coordinating specialized teams in a YouTube sentiment analysis system.
@@ -88,6 +91,12 @@ ROUTING DECISION TREE:
    → Route to "Research team" first to gather all necessary data
    → After Research completes, route to "Analysis team" for synthesis
 
+6. FOLLOW-UPS needing BOTH new research and analysis of comments already retrieved:
+   Examples: "How does the sentiment compare with press coverage?" after comments were analyzed
+   → The two teams do not depend on each other: select ["Research team", "Analysis team"]
+     together and they will run in parallel
+   → Never select both when Analysis would need comments that Research has not retrieved yet
+
 SEQUENTIAL EXECUTION PATTERN:
 If Analysis team responds that they need comments/data:
 → Route back to "Research team" to retrieve missing information
@@ -105,6 +114,22 @@ Given the conversation history, analyze what data we have, what's missing, and d
 AGENT_SUFFIX = """\nWork autonomously according to your specialty, using the tools available to you. Do not ask for clarification. Your other team members (and other teams) will collaborate with you with their own specialties. You are chosen for a reason!"""
 
 
+# ============================================================================
+# AGENT PROMPT REGISTRY (suffixed prompts precompiled at import time)
+# ============================================================================
+
+AGENT_PROMPTS: Final[dict[str, str]] = {
+    "VideoSearch": VIDEO_SEARCH_PROMPT,
+    "CommentFinder": COMMENT_FINDER_PROMPT,
+    "Sentiment": SENTIMENT_AGENT_PROMPT,
+    "Topic": TOPIC_AGENT_PROMPT,
+}
+
+AUGMENTED_PROMPTS: Final[dict[str, str]] = {
+    name: raw + AGENT_SUFFIX for name, raw in AGENT_PROMPTS.items()
+}
+
+
 # ============================================================================
 # SUPERVISOR ROUTING QUESTION (added to all supervisor prompts)
 # ============================================================================
@@ -120,8 +145,27 @@ SUPERVISOR_ROUTING_QUESTION = """Based on the conversation above, perform this a
    - What's still missing to fully answer the user's question?
 
 3. ROUTING DECISION:
-   Select one of: {options}
+   Select one or more of: {options}
+   Respond with a list. Select several only when none of them needs the output of another
+   (e.g. ["Sentiment", "Topic"] once comments have been retrieved); they will run in parallel.
    
    - Research team: If we need to retrieve comments, search external sources, or gather missing data
    - Analysis team: If we have comments/data and need sentiment/topic analysis
    - FINISH: If the question is comprehensively answered with sufficient evidence"""
+
+
+# ============================================================================
+# CONVERSATION MEMORY SUMMARY (compacts older turns of a session thread)
+# ============================================================================
+
+CONVERSATION_SUMMARY_PROMPT = """You are condensing the earlier part of a conversation about a YouTube video's comments and sentiment.
+
+Conversation so far:
+{conversation}
+
+Write a concise summary under 200 words that preserves:
+- The questions the user asked
+- Key findings (sentiment, topics, notable comments, external facts) and their evidence
+- Any open threads the user may follow up on
+
+Do not add information that is not in the conversation."""
@@ -6,12 +6,16 @@ This module manages:
 - Session lifecycle (creation, retrieval, cleanup)
 """
 
+import threading
 import uuid
+from collections import OrderedDict
 from typing import Dict, Optional, Any
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
 from langchain_core.documents import Document
 
+from app.core.configuration import default_config
+
 
 @dataclass
 class VideoSession:
@@ -27,7 +31,8 @@ class VideoSession:
         main_graph: Compiled LangGraph with memory checkpointer
         documents: Cached documents for retrieval
         bm25_retriever: Cached BM25 retriever
-        raw_blobs: Cached raw video data (transcript, comments, etc.)
+        rag_graph: Compiled RAG graph for the video (used by batch queries)
+        config: LangGraph run config (thread_id and recursion limit)
     """
     session_id: str
     video_id: str
@@ -38,7 +43,8 @@ class VideoSession:
     main_graph: Any = None
     documents: list[Document] = field(default_factory=list)
     bm25_retriever: Any = None
-    raw_blobs: Dict[str, Any] = field(default_factory=dict)
+    rag_graph: Any = None
+    config: Dict[str, Any] = field(default_factory=dict)
 
 
 class SessionManager:
@@ -47,18 +53,32 @@ class SessionManager:
     This class provides:
     - Session creation for new video analyses
     - Session retrieval for follow-up questions
-    - Automatic session cleanup (TTL-based)
+    - Automatic session cleanup (TTL-based, with an LRU size cap)
     - Thread-scoped conversation memory
+
+    Sessions are kept in an OrderedDict ordered by last access, so the
+    least recently used session is always first and expiry only touches
+    sessions that have actually expired. All access goes through a lock
+    so endpoints running in the threadpool never see a torn dict.
     """
     
-    def __init__(self, session_ttl_hours: int = 24):
+    def __init__(self, session_ttl_hours: int = 24, max_sessions: int = 1000):
         """Initialize session manager.
         
         Args:
             session_ttl_hours: Time-to-live for sessions in hours (default: 24)
+            max_sessions: Maximum number of live sessions; the least recently
+                used session is evicted beyond this (default: 1000)
         """
-        self._sessions: Dict[str, VideoSession] = {}
+        self._max_sessions = max_sessions
+        self._sessions: "OrderedDict[str, VideoSession]" = OrderedDict()
         self._session_ttl = timedelta(hours=session_ttl_hours)
+        self._lock = threading.RLock()
+    
+    def _touch(self, session: VideoSession):
+        """Mark a session as most recently used. Caller must hold the lock."""
+        session.last_accessed = datetime.now()
+        self._sessions.move_to_end(session.session_id)
     
     def create_session(
         self,
@@ -76,14 +96,22 @@ class SessionManager:
         Returns:
             Unique session ID (thread_id) for this conversation
         """
-        session_id = str(uuid.uuid4())
+        session_id = uuid.uuid4().hex
         session = VideoSession(
             session_id=session_id,
             video_id=video_id,
             video_title=video_title,
-            channel_name=channel_name
+            channel_name=channel_name,
+            config={
+                "configurable": {"thread_id": session_id},
+                "recursion_limit": default_config.max_iterations
+            }
         )
-        self._sessions[session_id] = session
+        with self._lock:
+            self._sessions[session_id] = session
+            # Evict least recently used sessions beyond the cap
+            while len(self._sessions) > self._max_sessions:
+                self._sessions.popitem(last=False)
         return session_id
     
     def get_session(self, session_id: str) -> Optional[VideoSession]:
@@ -95,18 +123,19 @@ class SessionManager:
         Returns:
             VideoSession if found and not expired, None otherwise
         """
-        session = self._sessions.get(session_id)
-        if not session:
-            return None
-        
-        # Check if session has expired
-        if datetime.now() - session.last_accessed > self._session_ttl:
-            self.delete_session(session_id)
-            return None
-        
-        # Update last accessed time
-        session.last_accessed = datetime.now()
-        return session
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if not session:
+                return None
+            
+            # Check if session has expired
+            if datetime.now() - session.last_accessed > self._session_ttl:
+                del self._sessions[session_id]
+                return None
+            
+            # Update last accessed time
+            self._touch(session)
+            return session
     
     def update_session(
         self,
@@ -114,7 +143,7 @@ class SessionManager:
         main_graph: Any = None,
         documents: list[Document] = None,
         bm25_retriever: Any = None,
-        raw_blobs: Dict[str, Any] = None
+        rag_graph: Any = None
     ):
         """Update session with analysis artifacts.
         
@@ -123,22 +152,23 @@ class SessionManager:
             main_graph: Compiled LangGraph with checkpointer
             documents: Retrieved documents
             bm25_retriever: BM25 retriever instance
-            raw_blobs: Raw video data
+            rag_graph: Compiled RAG graph
         """
-        session = self._sessions.get(session_id)
-        if not session:
-            return
-        
-        if main_graph is not None:
-            session.main_graph = main_graph
-        if documents is not None:
-            session.documents = documents
-        if bm25_retriever is not None:
-            session.bm25_retriever = bm25_retriever
-        if raw_blobs is not None:
-            session.raw_blobs = raw_blobs
-        
-        session.last_accessed = datetime.now()
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if not session:
+                return
+            
+            if main_graph is not None:
+                session.main_graph = main_graph
+            if documents is not None:
+                session.documents = documents
+            if bm25_retriever is not None:
+                session.bm25_retriever = bm25_retriever
+            if rag_graph is not None:
+                session.rag_graph = rag_graph
+            
+            self._touch(session)
     
     def delete_session(self, session_id: str):
         """Delete a session.
@@ -146,22 +176,23 @@ class SessionManager:
         Args:
             session_id: Session identifier
         """
-        if session_id in self._sessions:
-            del self._sessions[session_id]
+        with self._lock:
+            self._sessions.pop(session_id, None)
     
     def cleanup_expired_sessions(self):
         """Remove all expired sessions.
         
         This should be called periodically (e.g., via background task).
+        Sessions are ordered by last access, so this stops at the first
+        session that is still live.
         """
         now = datetime.now()
-        expired_ids = [
-            sid for sid, session in self._sessions.items()
-            if now - session.last_accessed > self._session_ttl
-        ]
-        
-        for sid in expired_ids:
-            self.delete_session(sid)
+        with self._lock:
+            while self._sessions:
+                oldest = next(iter(self._sessions.values()))
+                if now - oldest.last_accessed <= self._session_ttl:
+                    break
+                self._sessions.popitem(last=False)
     
     def list_active_sessions(self) -> list[Dict[str, Any]]:
         """List all active sessions.
@@ -169,6 +200,8 @@ class SessionManager:
         Returns:
             List of session metadata
         """
+        with self._lock:
+            sessions = list(self._sessions.values())
         return [
             {
                 "session_id": session.session_id,
@@ -178,7 +211,7 @@ class SessionManager:
                 "created_at": session.created_at.isoformat(),
                 "last_accessed": session.last_accessed.isoformat()
             }
-            for session in self._sessions.values()
+            for session in sessions
         ]
 
 
@@ -17,9 +17,19 @@ from typing_extensions import TypedDict
 import operator
 
 from langchain_core.messages import BaseMessage
+from langgraph.graph.message import add_messages
 from langchain_core.documents import Document
 
 
+def keep_latest_documents(left: List[Document], right: List[Document]) -> List[Document]:
+    """Reducer for document channels updated by parallel nodes.
+
+    The latest non-empty update wins, so agents that return no documents do
+    not wipe documents retrieved by a sibling running in the same step.
+    """
+    return right if right else left
+
+
 class State(TypedDict):
     """Basic RAG state used for simple retrieval-augmented generation.
 
@@ -42,14 +52,14 @@ class ResearchTeamState(TypedDict):
 
     Fields:
         messages: Conversation history (accumulated with operator.add)
-        documents: Retrieved documents from CommentFinder
+        documents: Retrieved documents from CommentFinder (latest non-empty wins)
         team_members: List of agent names in the team
-        next: Routing decision (agent name or "FINISH")
+        next: Routing decision (agent names or ["FINISH"])
     """
     messages: Annotated[List[BaseMessage], operator.add]
-    documents: List[Document]
+    documents: Annotated[List[Document], keep_latest_documents]
     team_members: List[str]
-    next: str
+    next: List[str]
 
 
 class SentimentState(TypedDict):
@@ -59,14 +69,14 @@ class SentimentState(TypedDict):
 
     Fields:
         messages: Conversation history (accumulated with operator.add)
-        documents: Documents to analyze (from Research team)
+        documents: Documents to analyze (from Research team, latest non-empty wins)
         team_members: String of agent names in the team
-        next: Routing decision (agent name or "FINISH")
+        next: Routing decision (agent names or ["FINISH"])
     """
     messages: Annotated[List[BaseMessage], operator.add]
-    documents: List[Document]
+    documents: Annotated[List[Document], keep_latest_documents]
     team_members: str
-    next: str
+    next: List[str]
 
 
 class SuperState(TypedDict):
@@ -75,10 +85,13 @@ class SuperState(TypedDict):
     Coordinates between Research team and Analysis team.
 
     Fields:
-        messages: Overall conversation history (accumulated with operator.add)
-        documents: Documents passed between teams
-        next: Routing decision (team name or "FINISH")
+        messages: Overall conversation history (accumulated with add_messages,
+            so older turns can be replaced by a summary)
+        documents: Documents passed between teams (latest non-empty wins)
+        next: Routing decision (team names or ["FINISH"])
+        final_answer: Answer of the latest turn, merged from every team that ran
     """
-    messages: Annotated[List[BaseMessage], operator.add]
-    documents: List[Document]
-    next: str
+    messages: Annotated[List[BaseMessage], add_messages]
+    documents: Annotated[List[Document], keep_latest_documents]
+    next: List[str]
+    final_answer: str
@@ -3,23 +3,23 @@
 This module builds the Analysis Team graph that coordinates:
 - Sentiment agent (sentiment analysis with reflection)
 - Topic agent (topic extraction with reflection)
-- AnalysisSupervisor (routing between agents)
+- AnalysisSupervisor (reviews results and re-runs agents when needed)
+
+Topic and Sentiment are independent analyses of the same documents, so the
+graph fans out to both in parallel on entry and only then asks the
+supervisor whether another pass is needed.
 """
 
 import functools
 from typing import List
 from langchain_core.messages import HumanMessage
 from langchain_core.runnables import RunnableLambda
-from langgraph.graph import StateGraph, END
+from langgraph.graph import StateGraph, START, END
 
 from app.core.state import SentimentState
-from app.core.prompts import (
-    SENTIMENT_AGENT_PROMPT,
-    TOPIC_AGENT_PROMPT,
-    ANALYSIS_SUPERVISOR_PROMPT
-)
+from app.core.prompts import ANALYSIS_SUPERVISOR_PROMPT
 from app.agents.agent_factory import create_agent, agent_node
-from app.agents.supervisor import create_team_supervisor
+from app.agents.supervisor import create_team_supervisor, route_next
 from app.agents.analysis_tools import sentiment_think_tool, topic_think_tool
 
 
@@ -36,7 +36,7 @@ def build_analysis_graph(analysis_llm):
     topic_agent = create_agent(
         analysis_llm,
         [topic_think_tool],
-        TOPIC_AGENT_PROMPT
+        "Topic"
     )
     topic_node = functools.partial(agent_node, agent=topic_agent, name='Topic')
 
@@ -44,7 +44,7 @@ def build_analysis_graph(analysis_llm):
     sentiment_agent = create_agent(
         analysis_llm,
         [sentiment_think_tool],
-        SENTIMENT_AGENT_PROMPT
+        "Sentiment"
     )
     sentiment_node = functools.partial(agent_node, agent=sentiment_agent, name='Sentiment')
 
@@ -63,14 +63,18 @@ def build_analysis_graph(analysis_llm):
     sentiment_graph.add_node("Sentiment", sentiment_node)
     sentiment_graph.add_node("AnalysisSupervisor", analysis_supervisor_agent)
 
-    # Add edges (workers return to supervisor)
+    # Fan out to both agents in parallel on entry
+    sentiment_graph.add_edge(START, "Topic")
+    sentiment_graph.add_edge(START, "Sentiment")
+
+    # Add edges (workers return to supervisor, which runs once both finish)
     sentiment_graph.add_edge("Topic", "AnalysisSupervisor")
     sentiment_graph.add_edge("Sentiment", "AnalysisSupervisor")
 
     # Add conditional edges from supervisor
     sentiment_graph.add_conditional_edges(
         "AnalysisSupervisor",
-        lambda x: x["next"],
+        route_next,
         {
             "Topic": "Topic",
             "Sentiment": "Sentiment",
@@ -78,9 +82,6 @@ def build_analysis_graph(analysis_llm):
         }
     )
 
-    # Set entry point
-    sentiment_graph.set_entry_point("AnalysisSupervisor")
-
     # Compile
     return sentiment_graph.compile()
 
@@ -4,20 +4,109 @@ This module builds the main meta-graph that coordinates:
 - Research team (VideoSearch + CommentFinder)
 - Analysis team (Sentiment + Topic)
 - SuperSupervisor (routing between teams)
+- Answer (merges the answers of every team that ran this turn)
 
 Memory Management:
-- Uses MemorySaver checkpointer for conversation persistence
+- Uses the shared checkpointer (SQLite or in-memory) for conversation persistence
 - Thread-scoped memory enables follow-up questions
 - Maintains conversation history across multiple interactions
+- Summarizes older turns so long threads keep a bounded prompt size
 """
 
-from langchain_core.runnables import RunnableLambda
+import functools
+from functools import lru_cache
+
+from langchain_core.messages import (
+    HumanMessage,
+    RemoveMessage,
+    SystemMessage,
+    get_buffer_string
+)
+from langchain_core.output_parsers import StrOutputParser
+from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.runnables import Runnable, RunnableLambda
 from langgraph.graph import StateGraph, END
-from langgraph.checkpoint.memory import MemorySaver
+from langgraph.graph.message import REMOVE_ALL_MESSAGES
 
+from app.core.checkpointer import get_checkpointer
+from app.core.configuration import default_config
 from app.core.state import SuperState
-from app.core.prompts import SUPER_SUPERVISOR_PROMPT
-from app.agents.supervisor import create_team_supervisor
+from app.core.prompts import CONVERSATION_SUMMARY_PROMPT, SUPER_SUPERVISOR_PROMPT
+from app.agents.supervisor import create_team_supervisor, route_next
+
+
+def get_last_message(state: SuperState) -> str:
+    """Extract content from last message in state."""
+    return state["messages"][-1].content
+
+
+def join_graph(response: dict) -> dict:
+    """Format sub-graph response for parent graph.
+
+    Forwards every worker message of the team run, not just the last one:
+    team members can run in parallel, and each one's answer must reach the
+    parent graph. Worker messages are the named ones; the unnamed entry
+    message is the question the team was given.
+    """
+    result = {"messages": [message for message in response["messages"] if message.name]}
+    if response.get("documents"):
+        result["documents"] = response["documents"]
+    return result
+
+
+def merge_team_answers(state: SuperState) -> dict:
+    """Combine the agent answers of the current turn into the final answer.
+
+    The supervisor can run both teams in parallel, and a team forwards one
+    message per member, so the last message alone holds only part of the
+    answer. Every named (agent) message after the latest user question is
+    kept, the most recent per agent; a single answer is used as-is.
+
+    Args:
+        state: Main graph state after the supervisor finished
+
+    Returns:
+        Dictionary with the final_answer text
+    """
+    messages = state["messages"]
+    start = next(
+        (
+            i for i in range(len(messages) - 1, -1, -1)
+            if isinstance(messages[i], HumanMessage) and not messages[i].name
+        ),
+        -1
+    )
+    answers = {}
+    for message in messages[start + 1:]:
+        if message.name:
+            answers[message.name] = message.content
+
+    if not answers:
+        return {"final_answer": messages[-1].content if messages else ""}
+    if len(answers) == 1:
+        return {"final_answer": next(iter(answers.values()))}
+    return {
+        "final_answer": "\n\n".join(
+            f"**{name}:**\n{content}" for name, content in answers.items()
+        )
+    }
+
+
+async def run_research_team(state: SuperState, research_chain) -> dict:
+    """Run the research chain on the latest message."""
+    result = await research_chain.ainvoke(get_last_message(state))
+    return join_graph(result)
+
+
+async def get_messages_and_documents(state: SuperState, analysis_chain) -> dict:
+    """Extract and pass data to analysis chain."""
+    message = get_last_message(state)
+    documents = state.get("documents", [])
+
+    # Call analysis_chain with message and documents
+    result = await analysis_chain.ainvoke({"message": message, "documents": documents})
+
+    return join_graph(result)
 
 
 def build_main_graph(
@@ -27,7 +116,7 @@ def build_main_graph(
 ):
     """Build and compile the main SuperSupervisor graph with memory.
 
-    The graph uses a MemorySaver checkpointer to persist conversation
+    The graph uses the shared checkpointer to persist conversation
     history within each thread. This enables:
     - Follow-up questions in the same conversation
     - Conversation state recovery across requests
@@ -48,28 +137,6 @@ def build_main_graph(
         ["Research team", "Analysis team"]
     )
 
-    # Helper functions
-    def get_last_message(state: SuperState) -> str:
-        """Extract content from last message in state."""
-        return state["messages"][-1].content
-
-    def join_graph(response: dict):
-        """Format sub-graph response for parent graph."""
-        result = {"messages": [response["messages"][-1]]}
-        if "documents" in response and response["documents"]:
-            result["documents"] = response["documents"]
-        return result
-
-    def get_messages_and_documents(state: SuperState):
-        """Extract and pass data to analysis chain."""
-        message = state["messages"][-1].content
-        documents = state.get("documents", [])
-
-        # Call analysis_chain with message and documents
-        result = analysis_chain.invoke({"message": message, "documents": documents})
-
-        return join_graph(result)
-
     # Build graph
     super_graph = StateGraph(SuperState)
 
@@ -77,18 +144,22 @@ def build_main_graph(
     # Research team: get last message -> run research chain -> join result
     super_graph.add_node(
         "Research team",
-        get_last_message | research_chain | join_graph
+        functools.partial(run_research_team, research_chain=research_chain)
     )
 
     # Analysis team: get messages and documents -> run analysis chain
     super_graph.add_node(
         "Analysis team",
-        get_messages_and_documents
+        functools.partial(get_messages_and_documents, analysis_chain=analysis_chain)
     )
 
     # Super supervisor
     super_graph.add_node("SuperSupervisor", super_supervisor_agent)
 
+    # Final answer merged from every team that ran this turn
+    super_graph.add_node("Answer", merge_team_answers)
+    super_graph.add_edge("Answer", END)
+
     # Add edges (teams return to supervisor)
     super_graph.add_edge("Research team", "SuperSupervisor")
     super_graph.add_edge("Analysis team", "SuperSupervisor")
@@ -96,17 +167,88 @@ def build_main_graph(
     # Add conditional edges from super supervisor
     super_graph.add_conditional_edges(
         "SuperSupervisor",
-        lambda x: x["next"],
+        route_next,
         {
             "Analysis team": "Analysis team",
             "Research team": "Research team",
-            "FINISH": END
+            "FINISH": "Answer"
         }
     )
 
     # Set entry point
     super_graph.set_entry_point("SuperSupervisor")
 
-    # Compile with MemorySaver checkpointer for conversation persistence
-    checkpointer = MemorySaver()
-    return super_graph.compile(checkpointer=checkpointer)
+    # Compile with the shared checkpointer for conversation persistence
+    return super_graph.compile(checkpointer=get_checkpointer())
+
+
+@lru_cache(maxsize=1)
+def get_memory_summarization_chain() -> Runnable:
+    """Return the shared chain that condenses older conversation turns."""
+    from langchain_openai import ChatOpenAI
+
+    prompt = ChatPromptTemplate.from_messages([("human", CONVERSATION_SUMMARY_PROMPT)])
+    llm = ChatOpenAI(model=default_config.summarization_model)
+    return prompt | llm | StrOutputParser()
+
+
+async def summarize_conversation_memory(
+    main_graph,
+    config: dict,
+    max_messages: int = default_config.memory_max_messages,
+    margin: int = default_config.memory_summary_margin
+) -> bool:
+    """Replace older turns of a thread with a single summary message.
+
+    Keeps roughly the last ``max_messages`` messages verbatim, starting at a
+    user question so the kept window is a whole turn, and condenses everything
+    before it (including any earlier summary) into one SystemMessage. This
+    keeps prefill size bounded across many follow-up questions.
+
+    The thread is only compacted once it exceeds ``max_messages`` by more
+    than ``margin``, so the summary call runs every few turns rather than on
+    every turn after the threshold is first reached.
+
+    Args:
+        main_graph: Compiled main graph with a checkpointer
+        config: Run config carrying the thread_id
+        max_messages: Number of recent messages to keep verbatim
+        margin: Messages the thread may grow past max_messages before compaction
+
+    Returns:
+        True if the thread was compacted, False otherwise
+    """
+    snapshot = await main_graph.aget_state(config)
+    messages = snapshot.values.get("messages", [])
+    if len(messages) <= max_messages + margin:
+        return False
+
+    # Cut at the first user question inside the recent window
+    cut = next(
+        (
+            i for i in range(len(messages) - max_messages, len(messages))
+            if isinstance(messages[i], HumanMessage) and not messages[i].name
+        ),
+        None
+    )
+    if not cut:
+        return False
+
+    summary = await get_memory_summarization_chain().ainvoke(
+        {"conversation": get_buffer_string(messages[:cut])}
+    )
+
+    # Written as the Answer node, whose only edge leads to END, so the
+    # thread stays idle rather than scheduling another step
+    await main_graph.aupdate_state(
+        config,
+        {
+            "messages": [
+                RemoveMessage(id=REMOVE_ALL_MESSAGES),
+                SystemMessage(content=f"Summary of the earlier conversation:\n{summary}"),
+                *messages[cut:]
+            ]
+        },
+        as_node="Answer"
+    )
+    return True
@@ -3,20 +3,40 @@
 This module builds a simple RAG graph:
 1. Retrieve relevant documents using BM25
 2. Generate response using LLM with retrieved context
+
+Retrieval results are cached per question on the compiled graph, so repeated
+sub-queries skip BM25 scoring. Several independent questions can be answered
+in one call with batch_answer.
 """
 
+import hashlib
+from typing import List
+
+from langgraph.cache.memory import InMemoryCache
 from langgraph.graph import StateGraph, START, END
+from langgraph.types import CachePolicy
 
 from app.core.state import State
 from app.rag.retrieval import make_bm25_retrieve
 from app.rag.generation import make_generate
 
+# Seconds a cached retrieval result stays valid
+RETRIEVE_CACHE_TTL = 300
+
+# Maximum questions of one batch generating at the same time
+BATCH_MAX_CONCURRENCY = 16
+
+
+def _question_cache_key(state: State) -> str:
+    """Cache key for the retrieve node: a digest of the question text."""
+    return hashlib.blake2b(state["question"].encode(), digest_size=16).hexdigest()
+
 
 def build_rag_graph(bm25_retriever, generator_llm):
     """Build and compile the BM25 RAG graph.
 
     Args:
-        bm25_retriever: BM25Retriever instance
+        bm25_retriever: VectorizedBM25Retriever instance
         generator_llm: ChatOpenAI instance for generation
 
     Returns:
@@ -30,7 +50,11 @@ def build_rag_graph(bm25_retriever, generator_llm):
     graph = StateGraph(State)
 
     # Add nodes
-    graph.add_node("retrieve", retrieve_fn)
+    graph.add_node(
+        "retrieve",
+        retrieve_fn,
+        cache_policy=CachePolicy(key_func=_question_cache_key, ttl=RETRIEVE_CACHE_TTL)
+    )
     graph.add_node("generate", generate_fn)
 
     # Add edges
@@ -38,5 +62,31 @@ def build_rag_graph(bm25_retriever, generator_llm):
     graph.add_edge("retrieve", "generate")
     graph.add_edge("generate", END)
 
-    # Compile and return
-    return graph.compile()
+    # Compile with a cache owned by this graph; graphs are built per video,
+    # so cached retrievals never cross videos
+    return graph.compile(cache=InMemoryCache())
+
+
+async def batch_answer(
+    compiled_rag_graph,
+    questions: List[str],
+    max_concurrency: int = BATCH_MAX_CONCURRENCY
+) -> List[State]:
+    """Answer several independent questions with one RAG graph.
+
+    Runs the questions through abatch so they share the retriever, the
+    retrieval cache and the LLM client's connection pool, with their
+    generation calls overlapped.
+
+    Args:
+        compiled_rag_graph: Compiled RAG graph from build_rag_graph
+        questions: Questions to answer
+        max_concurrency: Maximum questions in flight at once
+
+    Returns:
+        Final RAG state (question, context, response) per question, in order
+    """
+    return await compiled_rag_graph.abatch(
+        [{"question": question} for question in questions],
+        config={"max_concurrency": max_concurrency}
+    )
@@ -12,13 +12,9 @@ from langchain_core.runnables import RunnableLambda
 from langgraph.graph import StateGraph, END
 
 from app.core.state import ResearchTeamState
-from app.core.prompts import (
-    VIDEO_SEARCH_PROMPT,
-    COMMENT_FINDER_PROMPT,
-    RESEARCH_SUPERVISOR_PROMPT
-)
+from app.core.prompts import RESEARCH_SUPERVISOR_PROMPT
 from app.agents.agent_factory import create_agent, agent_node, agent_node_with_docs
-from app.agents.supervisor import create_team_supervisor
+from app.agents.supervisor import create_team_supervisor, route_next
 
 
 def build_research_graph(
@@ -40,7 +36,7 @@ def build_research_graph(
     search_agent = create_agent(
         research_llm,
         [video_specific_search_tool],
-        VIDEO_SEARCH_PROMPT
+        "VideoSearch"
     )
     search_node = functools.partial(agent_node, agent=search_agent, name='VideoSearch')
 
@@ -48,7 +44,8 @@ def build_research_graph(
     research_agent = create_agent(
         research_llm,
         [retrieve_information_tool],
-        COMMENT_FINDER_PROMPT
+        "CommentFinder",
+        return_intermediate_steps=True
     )
     research_node = functools.partial(agent_node_with_docs, agent=research_agent, name='CommentFinder')
 
@@ -74,7 +71,7 @@ def build_research_graph(
     # Add conditional edges from supervisor
     research_graph.add_conditional_edges(
         "ResearchSupervisor",
-        lambda x: x["next"],
+        route_next,
         {"VideoSearch": "VideoSearch", "CommentFinder": "CommentFinder", "FINISH": END}
     )
 
@@ -100,9 +97,9 @@ def create_research_chain(compiled_research_graph):
             "messages": [HumanMessage(content=message)],
         }
 
-    def research_chain_with_docs(state):
+    async def research_chain_with_docs(state):
         """Run research chain and preserve documents in state."""
-        result = compiled_research_graph.invoke(state)
+        result = await compiled_research_graph.ainvoke(state)
 
         # Explicitly extract and preserve documents
         return {
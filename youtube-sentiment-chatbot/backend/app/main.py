@@ -2,10 +2,18 @@
 
 This module initializes and configures the FastAPI app with:
 - CORS middleware for frontend communication
+- Process-wide LLM response cache
+- Periodic cleanup of expired sessions
+- Shared conversation checkpointer (SQLite when CHECKPOINT_DB is set)
+- Startup warm-up of shared LLM clients and video-independent graphs
+- orjson encoding for JSON responses
 - API routes
 - Error handling
 """
 
+import asyncio
+from contextlib import asynccontextmanager
+
 from dotenv import load_dotenv
 
 # Load environment variables before any other imports
@@ -13,8 +21,45 @@ load_dotenv()
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from langchain_core.caches import InMemoryCache
+from langchain_core.globals import set_llm_cache
+
+from app.api.routes import router, warm_up
+from app.core.checkpointer import open_checkpointer
+from app.core.configuration import default_config
+from app.core.session_manager import session_manager
+
+# Seconds between sweeps of expired sessions
+SESSION_CLEANUP_INTERVAL = 300
+
+# Cache LLM responses process-wide so identical summarization and supervisor
+# calls within a session return without another API round-trip
+set_llm_cache(InMemoryCache(maxsize=default_config.llm_cache_size))
+
+
+async def _periodic_session_cleanup():
+    """Release expired sessions so abandoned graphs and indexes are freed."""
+    while True:
+        await asyncio.sleep(SESSION_CLEANUP_INTERVAL)
+        session_manager.cleanup_expired_sessions()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm shared graphs, open the checkpointer and run session cleanup."""
+    warm_up()
+    async with open_checkpointer(default_config.checkpoint_db):
+        cleanup_task = asyncio.create_task(_periodic_session_cleanup())
+        try:
+            yield
+        finally:
+            cleanup_task.cancel()
+            try:
+                await cleanup_task
+            except asyncio.CancelledError:
+                pass
 
-from app.api.routes import router
 
 # Create FastAPI app
 app = FastAPI(
@@ -22,7 +67,10 @@ app = FastAPI(
     description="Multi-agent sentiment analysis system for YouTube videos",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    # Encode JSON responses with orjson, as the event streams already are
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # Configure CORS for frontend communication
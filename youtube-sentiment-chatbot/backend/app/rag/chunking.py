@@ -1,13 +1,25 @@
 """Document chunking and preparation for RAG.
 
 This module handles:
-- Chunking video context (transcript + metadata) using RecursiveCharacterTextSplitter
+- Chunking video context (transcript + metadata) at sentence/line boundaries
 - Creating individual comment documents (no chunking)
 - Combining both for BM25 retrieval
+
+Boundary offsets are found with a single regex scan and chunk ends are
+located with binary search, so chunking a long transcript is one pass over
+the text rather than recursive per-separator splitting.
+
+Prepared documents are cached by video content (see document_cache_key),
+so re-ingesting an unchanged video skips chunking entirely.
 """
 
+import hashlib
+import re
+import threading
+from collections import OrderedDict
 from typing import List
-from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+import numpy as np
 from langchain_core.documents import Document
 
 
@@ -15,16 +27,94 @@ from langchain_core.documents import Document
 CHUNK_SIZE = 750
 CHUNK_OVERLAP = 150
 
+# Chunks end just after a sentence stop or a line break
+_BOUNDARY_RE = re.compile(r"[.\n]")
+
+# Number of videos whose prepared documents are kept (least recently used evicted)
+DOCUMENT_CACHE_SIZE = 128
+_document_cache: "OrderedDict[str, tuple]" = OrderedDict()
+_document_cache_lock = threading.Lock()
+
+
+def fast_split(text: str, size: int = CHUNK_SIZE, overlap: int = CHUNK_OVERLAP) -> List[str]:
+    """Split text into overlapping chunks that end at sentence or line boundaries.
+
+    Each chunk is at most ``size`` characters and ends at the last boundary
+    that fits, falling back to a hard cut when no boundary leaves room to
+    advance. The next chunk starts at the first boundary inside the last
+    ``overlap`` characters of the previous one.
+
+    Args:
+        text: Text to split
+        size: Maximum chunk length in characters (default: CHUNK_SIZE)
+        overlap: Maximum overlap between consecutive chunks (default: CHUNK_OVERLAP)
+
+    Returns:
+        List of non-empty, stripped chunks
+    """
+    if len(text) <= size:
+        stripped = text.strip()
+        return [stripped] if stripped else []
+
+    length = len(text)
+    # Offsets just past every boundary character, in increasing order
+    boundaries = np.fromiter(
+        (match.end() for match in _BOUNDARY_RE.finditer(text)), dtype=np.intp
+    )
+
+    chunks = []
+    start = 0
+    while start < length:
+        limit = start + size
+        if limit >= length:
+            end = length
+        else:
+            # Last boundary at or before the size limit, if it leaves progress
+            i = np.searchsorted(boundaries, limit, side="right") - 1
+            end = int(boundaries[i]) if i >= 0 and boundaries[i] > start + overlap else limit
+
+        chunk = text[start:end].strip()
+        if chunk:
+            chunks.append(chunk)
+        if end >= length:
+            break
+
+        # Start the next chunk on the first boundary within the overlap window
+        j = np.searchsorted(boundaries, end - overlap, side="left")
+        start = int(boundaries[j]) if j < len(boundaries) and boundaries[j] < end else end - overlap
+
+    return chunks
+
+
+def document_cache_key(unified_document: Document, formatted_comments: List[tuple]) -> str:
+    """Build the cache key for a video's prepared documents.
+
+    The unified document embeds the transcript and every comment field, so
+    a digest of its content identifies the prepared documents exactly.
+
+    Args:
+        unified_document: The unified video document with full content
+        formatted_comments: List of (text, author, likes, published) comment tuples
+
+    Returns:
+        Key of the form "<video_id>:<comment count>:<content digest>"
+    """
+    digest = hashlib.blake2b(unified_document.page_content.encode(), digest_size=8).hexdigest()
+    return f"{unified_document.metadata['video_id']}:{len(formatted_comments)}:{digest}"
+
 
 def prepare_documents_for_retrieval(
     unified_document: Document,
-    formatted_comments: List[dict]
+    formatted_comments: List[tuple]
 ) -> tuple[Document, List[Document], List[Document]]:
     """Prepare documents for BM25 retrieval by creating context and comment documents.
 
+    Results are cached by document_cache_key; cached documents are shared
+    between callers and must not be mutated.
+
     Args:
         unified_document: The unified video document with full content
-        formatted_comments: List of formatted comment dictionaries
+        formatted_comments: List of (text, author, likes, published) comment tuples
 
     Returns:
         Tuple of (context_doc, comment_docs, docs_for_store)
@@ -32,6 +122,27 @@ def prepare_documents_for_retrieval(
             - comment_docs: Individual documents per comment
             - docs_for_store: Combined chunks + comments for BM25 retriever
     """
+    key = document_cache_key(unified_document, formatted_comments)
+    with _document_cache_lock:
+        cached = _document_cache.get(key)
+        if cached is not None:
+            _document_cache.move_to_end(key)
+            return cached
+
+    prepared = _build_documents(unified_document, formatted_comments)
+
+    with _document_cache_lock:
+        _document_cache[key] = prepared
+        while len(_document_cache) > DOCUMENT_CACHE_SIZE:
+            _document_cache.popitem(last=False)
+    return prepared
+
+
+def _build_documents(
+    unified_document: Document,
+    formatted_comments: List[tuple]
+) -> tuple[Document, List[Document], List[Document]]:
+    """Build the context, comment and combined document lists (uncached)."""
     # Video-level context document
     context_doc = Document(
         page_content=unified_document.page_content,
@@ -44,30 +155,34 @@ def prepare_documents_for_retrieval(
         },
     )
 
-    # One document per comment with rich payload
+    # Video fields shared by every comment, looked up once
+    video_fields = {
+        "video_id": unified_document.metadata["video_id"],
+        "title": unified_document.metadata.get("title", ""),
+    }
+
+    # One document per comment with rich payload. The fields are already
+    # well-typed, so model_construct skips per-comment pydantic validation
     comment_docs = [
-        Document(
-            page_content=comment["text"],
+        Document.model_construct(
+            page_content=text,
             metadata={
                 "type": "comment",
-                "comment_index": idx + 1,
-                "author": comment["author"],
-                "likes": comment["likes"],
-                "published": comment["published"],
-                "video_id": unified_document.metadata["video_id"],
-                "title": unified_document.metadata.get("title", ""),
+                "comment_index": idx,
+                "author": author,
+                "likes": likes,
+                "published": published,
+                **video_fields,
             },
         )
-        for idx, comment in enumerate(formatted_comments)
+        for idx, (text, author, likes, published) in enumerate(formatted_comments, start=1)
     ]
 
-    # Chunk the context document
-    text_splitter = RecursiveCharacterTextSplitter(
-        chunk_size=CHUNK_SIZE,
-        chunk_overlap=CHUNK_OVERLAP,
-    )
-
-    context_chunks = text_splitter.split_documents([context_doc])
+    # Chunk the context document (each chunk gets its own metadata copy)
+    context_chunks = [
+        Document(page_content=chunk, metadata=dict(context_doc.metadata))
+        for chunk in fast_split(context_doc.page_content)
+    ]
 
     # CRITICAL: Combine context chunks + comment docs for BM25 retriever
     # No chunking for comments - they remain as individual documents
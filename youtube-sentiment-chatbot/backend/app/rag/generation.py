@@ -4,8 +4,14 @@ This module provides LLM-based response generation using:
 - Retrieved context (comments + video chunks)
 - User question
 - Structured prompt template
+
+Responses are cached per RAG graph by normalized question and retrieved
+documents, so a repeated or trivially reworded question over the same
+context skips the LLM call.
 """
 
+import hashlib
+from collections import OrderedDict
 from typing import List
 from typing_extensions import TypedDict
 from langchain_core.documents import Document
@@ -42,6 +48,54 @@ chat_prompt = ChatPromptTemplate.from_messages([
 ])
 
 
+# Generated responses kept per RAG graph (least recently used evicted)
+GENERATE_CACHE_SIZE = 256
+
+
+def _normalize_question(question: str) -> str:
+    """Normalize case, whitespace and trailing punctuation of a question."""
+    return " ".join(question.lower().split()).rstrip("?!. ")
+
+
+def format_context(context: List[Document]) -> str:
+    """Render retrieved documents as compact prompt text.
+
+    Only the content is sent, plus a short attribution line for comments
+    (index, author, likes) since the prompt asks the model to weigh who
+    commented; the rest of the metadata would only cost prompt tokens.
+
+    Args:
+        context: Retrieved documents
+
+    Returns:
+        Documents separated by "---" lines
+    """
+    parts = []
+    for doc in context:
+        metadata = doc.metadata
+        if metadata.get("type") == "comment":
+            parts.append(
+                f"[c{metadata.get('comment_index', '')}] {metadata.get('author', '')} "
+                f"({metadata.get('likes', 0)} likes): {doc.page_content}"
+            )
+        else:
+            parts.append(doc.page_content)
+    return "\n---\n".join(parts)
+
+
+def _generation_cache_key(question: str, context: List[Document]) -> str:
+    """Cache key for a response: the normalized question plus the retrieved documents.
+
+    Documents are hashed in sorted order, so the same top-k in a different
+    rank order maps to the same response.
+    """
+    digest = hashlib.blake2b(_normalize_question(question).encode(), digest_size=16)
+    for content in sorted(doc.page_content for doc in context):
+        digest.update(b"\x00")
+        digest.update(content.encode())
+    return digest.hexdigest()
+
+
 def create_generator_llm(model: str = "gpt-4.1-nano") -> ChatOpenAI:
     """Create a ChatOpenAI instance for generation.
 
@@ -68,7 +122,7 @@ def generate(state: State, generator_llm: ChatOpenAI, prompt: ChatPromptTemplate
     generator_chain = prompt | generator_llm | StrOutputParser()
     response = generator_chain.invoke({
         "query": state['question'],
-        "context": state["context"]
+        "context": format_context(state["context"])
     })
     return {'response': response}
 
@@ -77,21 +131,35 @@ def make_generate(generator_llm: ChatOpenAI, prompt: ChatPromptTemplate = chat_p
     """Create a generate function bound to a specific LLM and prompt.
 
     This factory pattern is useful for LangGraph integration where you need
-    a function that only takes state as input.
+    a function that only takes state as input. The returned function keeps
+    its own response cache (see _generation_cache_key).
 
     Args:
         generator_llm: ChatOpenAI model instance
         prompt: Chat prompt template (default: chat_prompt)
 
     Returns:
-        Generation function for use in LangGraph
+        Async generation function for use in LangGraph
     """
-    def generate_fn(state: State) -> dict:
-        generator_chain = prompt | generator_llm | StrOutputParser()
-        response = generator_chain.invoke({
+    # Compose the chain once; every call reuses the same RunnableSequence
+    generator_chain = prompt | generator_llm | StrOutputParser()
+    response_cache: "OrderedDict[str, str]" = OrderedDict()
+
+    async def generate_fn(state: State) -> dict:
+        key = _generation_cache_key(state['question'], state["context"])
+        response = response_cache.get(key)
+        if response is not None:
+            response_cache.move_to_end(key)
+            return {'response': response}
+
+        response = await generator_chain.ainvoke({
             "query": state['question'],
-            "context": state["context"]
+            "context": format_context(state["context"])
         })
+
+        response_cache[key] = response
+        if len(response_cache) > GENERATE_CACHE_SIZE:
+            response_cache.popitem(last=False)
         return {'response': response}
 
     return generate_fn
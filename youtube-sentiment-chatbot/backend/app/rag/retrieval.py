@@ -3,12 +3,26 @@
 This module provides BM25-based keyword retrieval for:
 - Video context chunks
 - Individual comment documents
+
+Term weights are precomputed into per-term numpy posting arrays when the
+retriever is built, so a query only sums the postings of its terms instead
+of looping over every document in Python. Built retrievers can be cached
+under the same key as the prepared documents they index.
 """
 
-from typing import List
+import threading
+from collections import Counter, OrderedDict
+from typing import Any, Dict, List, Optional
+
+import numpy as np
 from typing_extensions import TypedDict
+from langchain_core.callbacks import (
+    AsyncCallbackManagerForRetrieverRun,
+    CallbackManagerForRetrieverRun,
+)
 from langchain_core.documents import Document
-from langchain_community.retrievers import BM25Retriever
+from langchain_core.retrievers import BaseRetriever
+from pydantic import ConfigDict, Field
 
 
 class State(TypedDict):
@@ -18,20 +32,156 @@ class State(TypedDict):
     response: str
 
 
-def create_bm25_retriever(docs_for_store: List[Document]) -> BM25Retriever:
+class VectorizedBM25Retriever(BaseRetriever):
+    """BM25 (Okapi) retriever with scoring precomputed at build time.
+
+    Scores match rank_bm25's BM25Okapi (whitespace tokenization, k1=1.5,
+    b=0.75, negative idf floored to epsilon * mean idf), as used by
+    LangChain's BM25Retriever.
+
+    A query already touches only the postings of its own terms. Those are
+    accumulated into a dense score array and ranked with argpartition
+    rather than pruned WAND-style: at the corpus sizes a video produces
+    (tens to a few thousand documents), the fixed numpy overhead of
+    gathering and deduplicating candidates costs more than the dense pass.
+
+    Attributes:
+        docs: Indexed documents
+        k: Number of documents to return
+        vocab: Term to term id mapping
+        postings: Per term id, (document ids, BM25 weights) numpy arrays
+    """
+
+    docs: List[Document] = Field(repr=False)
+    k: int = 4
+    vocab: Dict[str, int] = Field(default_factory=dict, repr=False)
+    postings: List[Any] = Field(default_factory=list, repr=False)
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    @classmethod
+    def from_documents(
+        cls,
+        documents: List[Document],
+        k1: float = 1.5,
+        b: float = 0.75,
+        epsilon: float = 0.25,
+        **kwargs: Any
+    ) -> "VectorizedBM25Retriever":
+        """Tokenize documents once and build the BM25 posting arrays.
+
+        Args:
+            documents: Documents to index
+            k1: Term frequency saturation parameter
+            b: Document length normalization parameter
+            epsilon: Floor for negative idf, as a fraction of the mean idf
+            **kwargs: Other retriever fields (e.g. k)
+
+        Returns:
+            Configured VectorizedBM25Retriever instance
+        """
+        docs = list(documents)
+        doc_len = np.empty(len(docs))
+        vocab: Dict[str, int] = {}
+        term_docs: List[List[int]] = []
+        term_freqs: List[List[int]] = []
+
+        for doc_id, doc in enumerate(docs):
+            tokens = doc.page_content.split()
+            doc_len[doc_id] = len(tokens)
+            for token, freq in Counter(tokens).items():
+                term_id = vocab.setdefault(token, len(vocab))
+                if term_id == len(term_docs):
+                    term_docs.append([])
+                    term_freqs.append([])
+                term_docs[term_id].append(doc_id)
+                term_freqs[term_id].append(freq)
+
+        postings = []
+        if vocab:
+            n_docs = len(docs)
+            doc_freq = np.fromiter(map(len, term_docs), dtype=float, count=len(vocab))
+            idf = np.log(n_docs - doc_freq + 0.5) - np.log(doc_freq + 0.5)
+            idf[idf < 0] = epsilon * idf.mean()
+            length_norm = k1 * (1 - b + b * doc_len / doc_len.mean())
+
+            for term_id, (ids, freqs) in enumerate(zip(term_docs, term_freqs)):
+                ids = np.asarray(ids, dtype=np.intp)
+                tf = np.asarray(freqs, dtype=float)
+                postings.append((ids, idf[term_id] * tf * (k1 + 1) / (tf + length_norm[ids])))
+
+        return cls(docs=docs, vocab=vocab, postings=postings, **kwargs)
+
+    def _get_relevant_documents(
+        self, query: str, *, run_manager: CallbackManagerForRetrieverRun
+    ) -> List[Document]:
+        return self._score(query)
+
+    async def _aget_relevant_documents(
+        self, query: str, *, run_manager: AsyncCallbackManagerForRetrieverRun
+    ) -> List[Document]:
+        # Scoring is a few vectorized adds, cheaper than the default hop to
+        # a thread executor, so run it inline on the event loop
+        return self._score(query)
+
+    def _score(self, query: str) -> List[Document]:
+        """Return the top-k documents for a query by BM25 score."""
+        if not self.docs:
+            return []
+
+        scores = np.zeros(len(self.docs))
+        for token in query.split():
+            term_id = self.vocab.get(token)
+            if term_id is not None:
+                doc_ids, weights = self.postings[term_id]
+                scores[doc_ids] += weights
+
+        k = min(self.k, len(self.docs))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [self.docs[i] for i in top]
+
+
+# Number of BM25 indexes kept by cache key (least recently used evicted)
+RETRIEVER_CACHE_SIZE = 128
+_retriever_cache: "OrderedDict[str, VectorizedBM25Retriever]" = OrderedDict()
+_retriever_cache_lock = threading.Lock()
+
+
+def create_bm25_retriever(
+    docs_for_store: List[Document],
+    cache_key: Optional[str] = None
+) -> VectorizedBM25Retriever:
     """Create a BM25 retriever from prepared documents.
 
     Args:
         docs_for_store: Combined list of context chunks and comment documents
+        cache_key: Key identifying docs_for_store (see
+            chunking.document_cache_key); when given, the built index is
+            reused for later calls with the same key
 
     Returns:
-        Configured BM25Retriever instance
+        Configured VectorizedBM25Retriever instance
     """
-    bm25_retriever = BM25Retriever.from_documents(docs_for_store)
+    if cache_key is None:
+        return VectorizedBM25Retriever.from_documents(docs_for_store)
+
+    with _retriever_cache_lock:
+        cached = _retriever_cache.get(cache_key)
+        if cached is not None:
+            _retriever_cache.move_to_end(cache_key)
+            return cached
+
+    bm25_retriever = VectorizedBM25Retriever.from_documents(docs_for_store)
+
+    with _retriever_cache_lock:
+        _retriever_cache[cache_key] = bm25_retriever
+        while len(_retriever_cache) > RETRIEVER_CACHE_SIZE:
+            _retriever_cache.popitem(last=False)
     return bm25_retriever
 
 
-def bm25_retrieve(state: State, bm25_retriever: BM25Retriever) -> dict:
+def bm25_retrieve(state: State, bm25_retriever: VectorizedBM25Retriever) -> dict:
     """Retrieve relevant documents using BM25 algorithm.
 
     Args:
@@ -45,7 +195,7 @@ def bm25_retrieve(state: State, bm25_retriever: BM25Retriever) -> dict:
     return {"context": retrieved_docs}
 
 
-def make_bm25_retrieve(bm25_retriever: BM25Retriever):
+def make_bm25_retrieve(bm25_retriever: VectorizedBM25Retriever):
     """Create a BM25 retrieve function bound to a specific retriever.
 
     This factory pattern is useful for LangGraph integration where you need
@@ -55,10 +205,10 @@ def make_bm25_retrieve(bm25_retriever: BM25Retriever):
         bm25_retriever: Configured BM25 retriever instance
 
     Returns:
-        Retrieval function for use in LangGraph
+        Async retrieval function for use in LangGraph
     """
-    def retrieve_fn(state: State) -> dict:
-        retrieved_docs = bm25_retriever.invoke(state['question'])
+    async def retrieve_fn(state: State) -> dict:
+        retrieved_docs = await bm25_retriever.ainvoke(state['question'])
         return {"context": retrieved_docs}
 
     return retrieve_fn
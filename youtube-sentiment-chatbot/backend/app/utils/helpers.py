@@ -10,6 +10,11 @@ import re
 from typing import Optional
 
 
+# Compiled once at import: a bare video ID, and the ID inside any supported URL form
+_VIDEO_ID_RE = re.compile(r'[A-Za-z0-9_-]{11}')
+_URL_RE = re.compile(r'(?:youtube\.com/(?:watch\?v=|embed/|v/)|youtu\.be/)([A-Za-z0-9_-]{11})')
+
+
 def extract_video_id(url: str) -> Optional[str]:
     """Extract video ID from a YouTube URL.
 
@@ -26,23 +31,11 @@ def extract_video_id(url: str) -> Optional[str]:
         Extracted video ID or None if not found
     """
     # If it's already just a video ID (11 characters, alphanumeric + - and _)
-    if re.match(r'^[A-Za-z0-9_-]{11}$', url):
+    if _VIDEO_ID_RE.fullmatch(url):
         return url
 
-    # Common YouTube URL patterns
-    patterns = [
-        r'(?:youtube\.com\/watch\?v=)([A-Za-z0-9_-]{11})',
-        r'(?:youtu\.be\/)([A-Za-z0-9_-]{11})',
-        r'(?:youtube\.com\/embed\/)([A-Za-z0-9_-]{11})',
-        r'(?:youtube\.com\/v\/)([A-Za-z0-9_-]{11})',
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, url)
-        if match:
-            return match.group(1)
-
-    return None
+    match = _URL_RE.search(url)
+    return match.group(1) if match else None
 
 
 def format_agent_message(agent_name: str, content: str) -> dict:
@@ -77,31 +70,51 @@ def format_progress_message(content: str) -> dict:
     }
 
 
-def format_final_response(content: str, documents: list = None) -> dict:
-    """Format final response message.
+def format_final_start() -> dict:
+    """Format the frame that opens a streamed final response.
+
+    The final response is sent as final_start, one final_doc per document
+    and final_end, so large document sets are never encoded in one frame.
+
+    Returns:
+        Formatted final_start dictionary
+    """
+    return {
+        "type": "final_start"
+    }
+
+
+def format_final_document(doc) -> dict:
+    """Format one retrieved document of a streamed final response.
 
     Args:
-        content: Final response content
-        documents: Optional list of relevant documents
+        doc: Retrieved document
 
     Returns:
-        Formatted final response dictionary
+        Formatted final_doc dictionary
     """
-    response = {
-        "type": "final",
-        "content": content
+    return {
+        "type": "final_doc",
+        "doc": {
+            "content": doc.page_content,
+            "metadata": doc.metadata
+        }
     }
 
-    if documents:
-        response["documents"] = [
-            {
-                "content": doc.page_content,
-                "metadata": doc.metadata
-            }
-            for doc in documents
-        ]
 
-    return response
+def format_final_end(content: str) -> dict:
+    """Format the frame that closes a streamed final response.
+
+    Args:
+        content: Final response content
+
+    Returns:
+        Formatted final_end dictionary
+    """
+    return {
+        "type": "final_end",
+        "content": content
+    }
 
 
 def format_error_message(error: str) -> dict:
@@ -0,0 +1,100 @@
+"""Disk cache for YouTube collector responses.
+
+This module provides:
+- A lazily opened diskcache.Cache shared by the collectors (and processes)
+- The cached decorator: TTL memoization keyed by function and arguments,
+  with a shorter TTL for known-unavailable results (comments disabled, no
+  transcript) so such videos do not refetch on every build
+- invalidate: drop every cached response for a video
+- cache_stats: hit/miss counters
+
+Entries are tagged with the video ID (the first collector argument), so one
+video can be evicted regardless of which arguments its responses were
+fetched with. Set YOUTUBE_CACHE_DIR to an empty string to disable caching.
+"""
+
+import functools
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Optional, Tuple
+
+from app.core.configuration import default_config
+
+if TYPE_CHECKING:
+    from diskcache import Cache
+
+# Seconds cached responses stay valid
+METADATA_TTL = 24 * 60 * 60
+TRANSCRIPT_TTL = 7 * 24 * 60 * 60
+UNAVAILABLE_TTL = 60 * 60
+
+
+@lru_cache(maxsize=1)
+def get_cache() -> Optional["Cache"]:
+    """Return the shared disk cache, or None when caching is disabled."""
+    if not default_config.youtube_cache_dir:
+        return None
+
+    from diskcache import Cache
+
+    cache = Cache(default_config.youtube_cache_dir, tag_index=True)
+    cache.stats(enable=True)
+    return cache
+
+
+def cached(expire: int, unavailable: Optional[Callable[[Any], bool]] = None) -> Callable:
+    """Memoize a collector on disk for ``expire`` seconds.
+
+    Responses carrying an ``error`` key (API errors, failed transcript
+    fetches) are returned but not cached, so they are retried next time,
+    unless ``unavailable`` marks them as a lasting condition of the video.
+    Those are cached for UNAVAILABLE_TTL seconds.
+
+    Args:
+        expire: Time-to-live of cached responses in seconds
+        unavailable: Optional predicate telling which error responses mean
+            the data does not exist (rather than a transient failure)
+
+    Returns:
+        Decorator for collectors whose first argument is the video ID
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(video_id: str, *args, **kwargs):
+            cache = get_cache()
+            if cache is None:
+                return func(video_id, *args, **kwargs)
+
+            key = (func.__name__, video_id, *args, *sorted(kwargs.items()))
+            result = cache.get(key)
+            if result is not None:
+                return result
+
+            result = func(video_id, *args, **kwargs)
+            if not (isinstance(result, dict) and "error" in result):
+                cache.set(key, result, expire=expire, tag=video_id)
+            elif unavailable is not None and unavailable(result):
+                cache.set(key, result, expire=UNAVAILABLE_TTL, tag=video_id)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def invalidate(video_id: str) -> int:
+    """Drop every cached response for a video.
+
+    Args:
+        video_id: YouTube video ID
+
+    Returns:
+        Number of entries removed
+    """
+    cache = get_cache()
+    return cache.evict(video_id) if cache is not None else 0
+
+
+def cache_stats() -> Tuple[int, int]:
+    """Return the (hits, misses) counters of the disk cache."""
+    cache = get_cache()
+    return cache.stats() if cache is not None else (0, 0)
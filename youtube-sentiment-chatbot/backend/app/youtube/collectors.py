@@ -4,19 +4,82 @@ This module contains functions to fetch YouTube video data including:
 - Comments with metadata (author, likes, published date)
 - Video details (title, description, statistics)
 - Video transcripts
+
+YouTube Data API calls share one pooled HTTP session, so repeat fetches
+reuse open TLS connections to googleapis.com instead of handshaking each time,
+and ask for gzip-compressed bodies, which are parsed with orjson. Callers can
+pass a partial-response ``fields`` mask to download only what they read.
+Responses are cached on disk (see app.youtube.cache): details and comments
+for a day, transcripts for a week, and known-missing comments or transcripts
+for an hour.
 """
 
+import logging
 import os
+from typing import Optional
+
+import orjson
 import requests
-from youtube_transcript_api import YouTubeTranscriptApi
+from requests.adapters import HTTPAdapter
+from youtube_transcript_api import (
+    NoTranscriptFound,
+    TranscriptsDisabled,
+    VideoUnavailable,
+    YouTubeTranscriptApi,
+)
+
+from .cache import METADATA_TTL, TRANSCRIPT_TTL, cached
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait on a YouTube Data API response
+YOUTUBE_API_TIMEOUT = 10
+# Data API error reasons meaning a video's comments do not exist, as opposed
+# to quota, auth or transient failures
+_COMMENTS_UNAVAILABLE_REASONS = frozenset({"commentsDisabled", "videoNotFound"})
+
+# Transcript errors that persist for a video until its owner changes it
+_TRANSCRIPT_UNAVAILABLE_ERRORS = (TranscriptsDisabled, NoTranscriptFound, VideoUnavailable)
+
+# Shared keep-alive session for the YouTube Data API; sized for concurrent ingests
+_api_session = requests.Session()
+_api_session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=50))
+# Google APIs only gzip responses for clients whose User-Agent contains "gzip"
+_api_session.headers["User-Agent"] = f"{requests.utils.default_user_agent()} (gzip)"
+
+
+def _comments_unavailable(response: dict) -> bool:
+    """Tell whether a commentThreads error response means no comments exist."""
+    errors = response["error"].get("errors", ()) if isinstance(response["error"], dict) else ()
+    return any(error.get("reason") in _COMMENTS_UNAVAILABLE_REASONS for error in errors)
+
+
+def is_transient_error(response: dict) -> bool:
+    """Tell whether a collector response is a failure worth retrying.
+
+    Error responses meaning the data does not exist (comments disabled,
+    video not found, no transcript) are stable results, like the disk cache
+    treats them; quota, auth and network failures are transient.
+
+    Args:
+        response: Response returned by one of the collectors
+
+    Returns:
+        True if the response carries an error that may succeed on retry
+    """
+    if not (isinstance(response, dict) and "error" in response):
+        return False
+    return not (response.get("unavailable") or _comments_unavailable(response))
 
 
-def get_youtube_comments(video_id: str, max_comments: int = 50):
+@cached(expire=METADATA_TTL, unavailable=_comments_unavailable)
+def get_youtube_comments(video_id: str, max_comments: int = 50, fields: Optional[str] = None):
     """Fetch comments from a YouTube video using YouTube Data API v3.
 
     Args:
         video_id: YouTube video ID
         max_comments: Maximum number of comments to retrieve (default: 50)
+        fields: Optional partial-response mask limiting the returned fields
 
     Returns:
         JSON response with comment threads from YouTube API
@@ -31,15 +94,19 @@ def get_youtube_comments(video_id: str, max_comments: int = 50):
         'maxResults': max_comments,
         'key': os.environ['YOUTUBE_API_KEY']
     }
-    response = requests.get(url, params=params)
-    return response.json()
+    if fields:
+        params['fields'] = fields
+    response = _api_session.get(url, params=params, timeout=YOUTUBE_API_TIMEOUT)
+    return orjson.loads(response.content)
 
 
-def get_video_details(video_id: str):
+@cached(expire=METADATA_TTL)
+def get_video_details(video_id: str, fields: Optional[str] = None):
     """Get video metadata including title, description, channel info, etc.
 
     Args:
         video_id: YouTube video ID
+        fields: Optional partial-response mask limiting the returned fields
 
     Returns:
         JSON response with video snippet, statistics, and contentDetails
@@ -53,10 +120,13 @@ def get_video_details(video_id: str):
         'id': video_id,
         'key': os.environ['YOUTUBE_API_KEY']
     }
-    response = requests.get(url, params=params)
-    return response.json()
+    if fields:
+        params['fields'] = fields
+    response = _api_session.get(url, params=params, timeout=YOUTUBE_API_TIMEOUT)
+    return orjson.loads(response.content)
 
 
+@cached(expire=TRANSCRIPT_TTL, unavailable=lambda result: result.get("unavailable", False))
 def get_video_transcript(video_id: str):
     """Get video transcript using YouTube Transcript API.
 
@@ -65,20 +135,21 @@ def get_video_transcript(video_id: str):
 
     Returns:
         Dictionary with 'transcript' key containing concatenated text,
-        or 'error' key if transcript fetch failed
+        or 'error' key if transcript fetch failed ('unavailable' is set when
+        the video has no transcript to fetch)
     """
     try:
         api = YouTubeTranscriptApi()
         full_transcript = api.fetch(video_id)
-        transcript_text = " ".join(
-            full_transcript.snippets[i].text for i in range(len(full_transcript.snippets))
-        )
-        print(f"DEBUG: Transcript fetched for {video_id}, length={len(transcript_text)}")
+        transcript_text = " ".join(snippet.text for snippet in full_transcript.snippets)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Transcript fetched for %s, length=%d", video_id, len(transcript_text))
         return {"transcript": transcript_text}
 
     except Exception as exc:  # noqa: BLE001
-        print(f"WARNING: Transcript fetch failed for {video_id}: {exc}")
+        logger.warning("Transcript fetch failed for %s: %s", video_id, exc)
         return {
             "transcript": "",
             "error": f"Unable to fetch transcript: {exc}",
+            "unavailable": isinstance(exc, _TRANSCRIPT_UNAVAILABLE_ERRORS),
         }
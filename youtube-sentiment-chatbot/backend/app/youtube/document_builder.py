@@ -4,50 +4,61 @@ This module creates a comprehensive LangChain Document containing all video cont
 - Video metadata (title, channel, views, likes)
 - Video transcript
 - Comments with rich metadata (author, likes, published date)
+
+The three sources are independent, so they are fetched concurrently.
 """
 
+import heapq
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+from typing import List, Optional, Tuple
+
 from langchain_core.documents import Document
 from .collectors import get_youtube_comments, get_video_details, get_video_transcript
 
-
-def create_unified_video_document(video_id: str, max_comments: int = 50):
-    """Create a unified document containing video details, transcript, and comments.
-
-    This gives the chatbot complete context about the video.
+# Likes field of a (text, author, likes, published) comment row
+_row_likes = itemgetter(2)
+
+# Bounds on the comments section of the unified content. Each comment also
+# gets its own full-text document for retrieval, so capping the rendered
+# copy loses nothing searchable
+MAX_COMMENT_CHARS = 1000
+MAX_COMMENTS_SECTION_CHARS = 500_000
+
+# Partial-response masks: only the fields this module reads are downloaded
+_DETAILS_FIELDS = (
+    "items(snippet(title,channelTitle,publishedAt,description),"
+    "statistics(viewCount,likeCount,commentCount))"
+)
+_COMMENTS_FIELDS = (
+    "items(snippet(topLevelComment(snippet("
+    "textDisplay,authorDisplayName,likeCount,publishedAt))))"
+)
+
+
+def _iter_content(
+    snippet: dict,
+    statistics: dict,
+    transcript_data: dict,
+    formatted_comments: list,
+    max_comment_chars: int = MAX_COMMENT_CHARS,
+    max_section_chars: int = MAX_COMMENTS_SECTION_CHARS
+):
+    """Yield the unified document content piece by piece.
 
     Args:
-        video_id: YouTube video ID
-        max_comments: Maximum number of comments to retrieve (default: 50)
-
-    Returns:
-        Tuple of (unified_document, raw_blobs):
-            - unified_document: LangChain Document with formatted content and metadata
-            - raw_blobs: Dict containing raw API responses and formatted comments
+        snippet: Video snippet from the videos API response
+        statistics: Video statistics from the videos API response
+        transcript_data: Transcript collector response
+        formatted_comments: List of (text, author, likes, published) tuples
+        max_comment_chars: Characters of each comment's text to render
+        max_section_chars: Size of the rendered comment blocks after which
+            the remaining comments are replaced by a truncation marker
+
+    Yields:
+        The video header, then one block per comment
     """
-    # Get all data
-    video_details = get_video_details(video_id)
-    comments_data = get_youtube_comments(video_id, max_comments)
-    transcript_data = get_video_transcript(video_id)
-
-    # Extract key information
-    video_info = video_details['items'][0] if video_details.get('items') else {}
-    snippet = video_info.get('snippet', {})
-    statistics = video_info.get('statistics', {})
-
-    # Format comments
-    formatted_comments = []
-    if 'items' in comments_data:
-        for item in comments_data['items']:
-            comment = item['snippet']['topLevelComment']['snippet']
-            formatted_comments.append({
-                'text': comment.get('textDisplay', ''),
-                'author': comment.get('authorDisplayName', ''),
-                'likes': comment.get('likeCount', 0),
-                'published': comment.get('publishedAt', '')
-            })
-
-    # Create unified content
-    unified_content = f"""
+    yield f"""
 # VIDEO ANALYSIS CONTEXT
 
 ## Video Information
@@ -70,16 +81,75 @@ def create_unified_video_document(video_id: str, max_comments: int = 50):
 ### Comment Details:
 """
 
-    # Add individual comments
-    for i, comment in enumerate(formatted_comments, 1):
-        unified_content += f"""
+    remaining = max_section_chars
+    for i, (text, author, likes, published) in enumerate(formatted_comments, 1):
+        block = f"""
 **Comment {i}:**
-- Author: {comment['author']}
-- Likes: {comment['likes']}
-- Published: {comment['published']}
-- Text: {comment['text']}
+- Author: {author}
+- Likes: {likes}
+- Published: {published}
+- Text: {text[:max_comment_chars]}
 ---
 """
+        remaining -= len(block)
+        if remaining < 0:
+            yield f"\n... (truncated {len(formatted_comments) - i + 1} more comments)\n"
+            return
+        yield block
+
+
+def _build_document(
+    video_id: str,
+    video_info: dict,
+    comments_data: dict,
+    transcript_data: dict,
+    max_comment_chars: int = MAX_COMMENT_CHARS,
+    max_section_chars: int = MAX_COMMENTS_SECTION_CHARS,
+    top_k: Optional[int] = None
+) -> Tuple[Document, List[tuple]]:
+    """Build the unified document for one video from its fetched sources.
+
+    Args:
+        video_id: YouTube video ID
+        video_info: The video's item from a videos.list response (empty if not found)
+        comments_data: commentThreads response
+        transcript_data: Transcript collector response
+        max_comment_chars: Characters of each comment's text to render
+        max_section_chars: Size cap of the rendered comments section
+        top_k: Keep only the top_k most liked comments, if given
+
+    Returns:
+        Tuple of (unified_document, formatted_comments)
+    """
+    # Extract key information
+    snippet = video_info.get('snippet', {})
+    statistics = video_info.get('statistics', {})
+
+    # Format comments as (text, author, likes, published) tuples rather than
+    # dicts. Fields are defaulted: the API omits the author of deleted or
+    # hidden channels and the like count when likes are hidden
+    formatted_comments = [
+        (
+            comment.get('textDisplay', ''),
+            comment.get('authorDisplayName', ''),
+            comment.get('likeCount', 0),
+            comment.get('publishedAt', '')
+        )
+        for comment in (
+            item['snippet']['topLevelComment']['snippet']
+            for item in comments_data.get('items', ())
+        )
+    ]
+    if top_k is not None:
+        # O(N log K) selection, most liked first (ties keep API order)
+        formatted_comments = heapq.nlargest(top_k, formatted_comments, key=_row_likes)
+
+    # Create unified content, joined once from the header and comment blocks
+    # so the comment text is never copied into an intermediate string
+    unified_content = "".join(_iter_content(
+        snippet, statistics, transcript_data, formatted_comments,
+        max_comment_chars, max_section_chars
+    ))
 
     # Create the document
     unified_document = Document(
@@ -94,13 +164,70 @@ def create_unified_video_document(video_id: str, max_comments: int = 50):
             "views": statistics.get('viewCount', 0),
             "likes": statistics.get('likeCount', 0),
             "published": snippet.get('publishedAt', ''),
+            "selected_top_k": top_k,
             "source": "youtube_unified"
         }
     )
 
-    return unified_document, {
-        'video_details': video_details,
-        'comments': comments_data,
+    return unified_document, formatted_comments
+
+
+def create_unified_video_document(
+    video_id: str,
+    max_comments: int = 50,
+    return_raw: bool = False,
+    max_comment_chars: int = MAX_COMMENT_CHARS,
+    max_section_chars: int = MAX_COMMENTS_SECTION_CHARS,
+    top_k: Optional[int] = None
+):
+    """Create a unified document containing video details, transcript, and comments.
+
+    This gives the chatbot complete context about the video.
+
+    Args:
+        video_id: YouTube video ID
+        max_comments: Maximum number of comments to retrieve (default: 50)
+        return_raw: Also return the raw video details and comment thread API
+            responses (default: False, so they can be freed once extracted)
+        max_comment_chars: Characters of each comment's text rendered into the
+            unified content (formatted_comments keep the full text)
+        max_section_chars: Size of the rendered comments section after which
+            the remaining comments are replaced by a truncation marker
+        top_k: Keep only the top_k most liked of the fetched comments, most
+            liked first (default: None, keep all in API order)
+
+    Returns:
+        Tuple of (unified_document, raw_blobs):
+            - unified_document: LangChain Document with formatted content and metadata
+            - raw_blobs: Dict with the transcript response and formatted comments
+              as (text, author, likes, published) tuples, plus the raw
+              'video_details' and 'comments' responses when return_raw is set
+    """
+    # Get all data, overlapping the three network round-trips. The transcript
+    # (the slowest source) is fetched on the calling thread, which would
+    # otherwise sit idle waiting for the pool
+    with ThreadPoolExecutor(max_workers=2, thread_name_prefix="youtube-fetch") as pool:
+        details_future = pool.submit(get_video_details, video_id, fields=_DETAILS_FIELDS)
+        comments_future = pool.submit(
+            get_youtube_comments, video_id, max_comments, fields=_COMMENTS_FIELDS
+        )
+        transcript_data = get_video_transcript(video_id)
+        video_details = details_future.result()
+        comments_data = comments_future.result()
+
+    video_info = video_details['items'][0] if video_details.get('items') else {}
+    unified_document, formatted_comments = _build_document(
+        video_id, video_info, comments_data, transcript_data,
+        max_comment_chars, max_section_chars, top_k
+    )
+
+    raw_blobs = {
         'transcript': transcript_data,
         'formatted_comments': formatted_comments
     }
+    if return_raw:
+        raw_blobs['video_details'] = video_details
+        raw_blobs['comments'] = comments_data
+
+    return unified_document, raw_blobs
+
@@ -0,0 +1,74 @@
+"""Tests for transcript chunking."""
+
+import random
+import string
+
+import pytest
+
+from app.rag.chunking import CHUNK_OVERLAP, CHUNK_SIZE, fast_split
+
+
+SENTENCES = "".join(
+    f"Sentence number {i} talks about topic {i % 7} in some detail.{chr(10) if i % 5 == 0 else ' '}"
+    for i in range(400)
+)
+
+
+def assert_covers(text, chunks):
+    """Every chunk appears in order in the text and together they cover it."""
+    position = -1
+    covered = 0
+    for chunk in chunks:
+        start = text.find(chunk, position + 1)
+        assert start != -1, "chunk is not a substring of the text"
+        # Only whitespace between the end of the previous chunk and this one
+        assert text[covered:start].strip() == ""
+        position = start
+        covered = max(covered, start + len(chunk))
+    assert text[covered:].strip() == ""
+
+
+@pytest.mark.parametrize("size,overlap", [(CHUNK_SIZE, CHUNK_OVERLAP), (200, 50), (64, 0)])
+def test_chunks_respect_size_and_cover_text(size, overlap):
+    chunks = fast_split(SENTENCES, size=size, overlap=overlap)
+
+    assert len(chunks) > 1
+    assert all(0 < len(chunk) <= size for chunk in chunks)
+    assert_covers(SENTENCES, chunks)
+
+
+def test_chunks_end_at_boundaries():
+    chunks = fast_split(SENTENCES)
+
+    # Every chunk but the last ends on a sentence stop (trailing space stripped)
+    assert all(chunk.endswith(".") for chunk in chunks[:-1])
+
+
+def test_consecutive_chunks_overlap_within_limit():
+    chunks = fast_split(SENTENCES)
+
+    position = -1
+    starts = []
+    for chunk in chunks:
+        position = SENTENCES.find(chunk, position + 1)
+        starts.append(position)
+
+    for (previous, previous_start), current_start in zip(zip(chunks, starts), starts[1:]):
+        assert 0 <= previous_start + len(previous) - current_start <= CHUNK_OVERLAP
+
+
+def test_text_without_boundaries_is_hard_cut():
+    text = "".join(random.Random(0).choices(string.ascii_lowercase, k=2000))
+
+    chunks = fast_split(text, size=500, overlap=100)
+
+    assert all(len(chunk) <= 500 for chunk in chunks)
+    assert_covers(text, chunks)
+
+
+def test_short_text_is_single_stripped_chunk():
+    assert fast_split("  short text.  ") == ["short text."]
+
+
+def test_blank_text_has_no_chunks():
+    assert fast_split("   ") == []
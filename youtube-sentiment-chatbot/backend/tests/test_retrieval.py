@@ -0,0 +1,97 @@
+"""Tests for the vectorized BM25 retriever."""
+
+import math
+from collections import Counter
+
+import pytest
+from langchain_core.documents import Document
+
+from app.rag.retrieval import VectorizedBM25Retriever, create_bm25_retriever
+
+
+CORPUS = [
+    "the video explains how solar panels convert sunlight",
+    "great video i loved the part about solar panels",
+    "this video is too long and the audio is bad",
+    "the audio mixing was bad but the editing was great",
+    "who else is watching this in 2024",
+    "solar solar solar panels are the future",
+    "i disagree with the claims about battery storage",
+    "battery storage is the real bottleneck for solar",
+]
+
+
+def reference_bm25_scores(corpus, query, k1=1.5, b=0.75, epsilon=0.25):
+    """Score every document like rank_bm25's BM25Okapi, in plain Python."""
+    tokenized = [text.split() for text in corpus]
+    avgdl = sum(map(len, tokenized)) / len(tokenized)
+    doc_freq = Counter(term for tokens in tokenized for term in set(tokens))
+
+    idf = {
+        term: math.log(len(tokenized) - df + 0.5) - math.log(df + 0.5)
+        for term, df in doc_freq.items()
+    }
+    floor = epsilon * sum(idf.values()) / len(idf)
+    idf = {term: value if value >= 0 else floor for term, value in idf.items()}
+
+    scores = []
+    for tokens in tokenized:
+        tf = Counter(tokens)
+        norm = k1 * (1 - b + b * len(tokens) / avgdl)
+        scores.append(sum(
+            idf[term] * tf[term] * (k1 + 1) / (tf[term] + norm)
+            for term in query.split() if term in tf
+        ))
+    return scores
+
+
+def make_docs(corpus):
+    return [Document(page_content=text, metadata={"id": i}) for i, text in enumerate(corpus)]
+
+
+@pytest.mark.parametrize("query", [
+    "solar panels",
+    "bad audio",
+    "battery storage solar",
+    "the video",
+    "great editing",
+])
+def test_ranking_matches_bm25okapi(query):
+    retriever = VectorizedBM25Retriever.from_documents(make_docs(CORPUS), k=len(CORPUS))
+    scores = reference_bm25_scores(CORPUS, query)
+
+    ranked = [doc.metadata["id"] for doc in retriever.invoke(query)]
+
+    # Ties may come back in any order, so compare the score sequence
+    assert [scores[i] for i in ranked] == pytest.approx(sorted(scores, reverse=True))
+
+
+def test_top_k_returns_highest_scoring_documents():
+    retriever = VectorizedBM25Retriever.from_documents(make_docs(CORPUS), k=2)
+    scores = reference_bm25_scores(CORPUS, "solar panels")
+
+    ranked = [doc.metadata["id"] for doc in retriever.invoke("solar panels")]
+
+    assert len(ranked) == 2
+    assert sorted(scores[i] for i in ranked) == pytest.approx(sorted(scores)[-2:])
+
+
+def test_unknown_query_terms_score_nothing():
+    retriever = VectorizedBM25Retriever.from_documents(make_docs(CORPUS), k=3)
+
+    assert len(retriever.invoke("zzz unknown")) == 3
+
+
+def test_empty_corpus_returns_no_documents():
+    retriever = VectorizedBM25Retriever.from_documents([])
+
+    assert retriever.invoke("solar") == []
+
+
+def test_create_bm25_retriever_reuses_cached_index():
+    docs = make_docs(CORPUS)
+
+    first = create_bm25_retriever(docs, cache_key="test:retrieval")
+    second = create_bm25_retriever(docs, cache_key="test:retrieval")
+
+    assert first is second
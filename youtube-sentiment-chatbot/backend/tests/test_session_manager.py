@@ -0,0 +1,66 @@
+"""Tests for session lifecycle management."""
+
+from datetime import datetime, timedelta
+
+from app.core.session_manager import SessionManager
+
+
+def create(manager, video_id):
+    return manager.create_session(video_id, f"Title {video_id}", "Channel")
+
+
+def test_least_recently_used_session_is_evicted_at_max_sessions():
+    manager = SessionManager(max_sessions=2)
+    first = create(manager, "video1")
+    second = create(manager, "video2")
+
+    third = create(manager, "video3")
+
+    assert manager.get_session(first) is None
+    assert manager.get_session(second) is not None
+    assert manager.get_session(third) is not None
+    assert len(manager.list_active_sessions()) == 2
+
+
+def test_access_protects_session_from_eviction():
+    manager = SessionManager(max_sessions=2)
+    first = create(manager, "video1")
+    second = create(manager, "video2")
+
+    manager.get_session(first)
+    create(manager, "video3")
+
+    assert manager.get_session(first) is not None
+    assert manager.get_session(second) is None
+
+
+def test_update_protects_session_from_eviction():
+    manager = SessionManager(max_sessions=2)
+    first = create(manager, "video1")
+    second = create(manager, "video2")
+
+    manager.update_session(first, documents=[])
+    create(manager, "video3")
+
+    assert manager.get_session(first) is not None
+    assert manager.get_session(second) is None
+
+
+def test_expired_session_is_not_returned():
+    manager = SessionManager(session_ttl_hours=1)
+    session_id = create(manager, "video1")
+    manager._sessions[session_id].last_accessed = datetime.now() - timedelta(hours=2)
+
+    assert manager.get_session(session_id) is None
+    assert manager.list_active_sessions() == []
+
+
+def test_cleanup_removes_only_expired_sessions():
+    manager = SessionManager(session_ttl_hours=1)
+    expired = create(manager, "video1")
+    live = create(manager, "video2")
+    manager._sessions[expired].last_accessed = datetime.now() - timedelta(hours=2)
+
+    manager.cleanup_expired_sessions()
+
+    assert [s["session_id"] for s in manager.list_active_sessions()] == [live]
@@ -0,0 +1,24 @@
+"""Tests for supervisor routing."""
+
+from app.agents.supervisor import route_next
+
+
+def test_single_member_string_becomes_list():
+    assert route_next({"next": "VideoSearch"}) == ["VideoSearch"]
+
+
+def test_multiple_members_fan_out_in_order():
+    assert route_next({"next": ["Sentiment", "Topic"]}) == ["Sentiment", "Topic"]
+
+
+def test_duplicate_members_are_removed():
+    assert route_next({"next": ["Topic", "Sentiment", "Topic"]}) == ["Topic", "Sentiment"]
+
+
+def test_finish_wins_over_other_members():
+    assert route_next({"next": ["Sentiment", "FINISH"]}) == ["FINISH"]
+    assert route_next({"next": "FINISH"}) == ["FINISH"]
+
+
+def test_empty_selection_finishes():
+    assert route_next({"next": []}) == ["FINISH"]
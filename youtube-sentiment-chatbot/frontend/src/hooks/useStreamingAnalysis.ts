@@ -6,6 +6,38 @@ import { useState, useCallback } from "react";
 import { apiClient } from "@/lib/api";
 import { StreamEventType } from "@/lib/types";
 
+/**
+ * Append a stream event, folding agent token chunks into one message.
+ *
+ * Chunk events extend the agent's in-progress message; the complete
+ * agent message, when it arrives, replaces it.
+ */
+function appendEvent(prev: StreamEventType[], event: StreamEventType): StreamEventType[] {
+  if (event.type !== "agent_message") {
+    return [...prev, event];
+  }
+
+  // Only look within the current run of agent messages (this turn)
+  let index = -1;
+  for (let i = prev.length - 1; i >= 0 && prev[i].type === "agent_message"; i--) {
+    const candidate = prev[i];
+    if (candidate.type === "agent_message" && candidate.chunk && candidate.agent === event.agent) {
+      index = i;
+      break;
+    }
+  }
+
+  if (index === -1) {
+    return [...prev, event];
+  }
+
+  const next = [...prev];
+  next[index] = event.chunk
+    ? { ...prev[index], content: prev[index].content + event.content }
+    : event;
+  return next;
+}
+
 export function useStreamingAnalysis() {
   const [events, setEvents] = useState<StreamEventType[]>([]);
   const [isStreaming, setIsStreaming] = useState(false);
@@ -25,7 +57,7 @@ export function useStreamingAnalysis() {
       await apiClient.analyzeVideo(
         { url, max_comments: maxComments, question },
         (event: StreamEventType) => {
-          setEvents((prev) => [...prev, event]);
+          setEvents((prev) => appendEvent(prev, event));
           
           // Capture session_id when created
           if (event.type === "session_created") {
@@ -61,7 +93,7 @@ export function useStreamingAnalysis() {
       await apiClient.queryVideo(
         { session_id: sessionId, question },
         (event: StreamEventType) => {
-          setEvents((prev) => [...prev, event]);
+          setEvents((prev) => appendEvent(prev, event));
         },
         (err: Error) => {
           setError(err);
@@ -2,7 +2,13 @@
  * API client for communicating with the FastAPI backend
  */
 
-import { VideoAnalysisRequest, QueryRequest } from "./types";
+import {
+  VideoAnalysisRequest,
+  QueryRequest,
+  BatchQueryRequest,
+  BatchQueryResponse,
+  RetrievedDocument,
+} from "./types";
 
 const API_BASE_URL = process.env.NEXT_PUBLIC_API_URL || "http://localhost:8000";
 
@@ -42,32 +48,7 @@ export class APIClient {
         throw new Error("Response body is null");
       }
 
-      // Read the stream
-      const reader = response.body.getReader();
-      const decoder = new TextDecoder();
-
-      while (true) {
-        const { done, value } = await reader.read();
-
-        if (done) {
-          break;
-        }
-
-        // Decode the chunk
-        const chunk = decoder.decode(value, { stream: true });
-
-        // Split by newlines in case multiple events are in one chunk
-        const lines = chunk.split("\n").filter((line) => line.trim());
-
-        for (const line of lines) {
-          try {
-            const event = JSON.parse(line);
-            onEvent(event);
-          } catch (e) {
-            console.error("Error parsing event:", e, "Line:", line);
-          }
-        }
-      }
+      await this.readEventStream(response.body, onEvent);
     } catch (error) {
       onError(error as Error);
     }
@@ -102,33 +83,97 @@ export class APIClient {
       }
 
       // Read the stream (same as analyzeVideo)
-      const reader = response.body.getReader();
-      const decoder = new TextDecoder();
+      await this.readEventStream(response.body, onEvent);
+    } catch (error) {
+      onError(error as Error);
+    }
+  }
+
+  /**
+   * Read a Server-Sent Events stream and dispatch each JSON event
+   */
+  private async readEventStream(
+    body: ReadableStream<Uint8Array>,
+    onEvent: (event: any) => void
+  ): Promise<void> {
+    const reader = body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = "";
 
-      while (true) {
-        const { done, value } = await reader.read();
+    // The final response arrives as final_start, final_doc..., final_end and
+    // is reassembled into a single "final" event for consumers
+    let finalDocuments: RetrievedDocument[] = [];
 
-        if (done) {
-          break;
+    while (true) {
+      const { done, value } = await reader.read();
+
+      if (done) {
+        break;
+      }
+
+      // Frames are separated by a blank line and may span chunks
+      buffer += decoder.decode(value, { stream: true });
+      const frames = buffer.split("\n\n");
+      buffer = frames.pop() ?? "";
+
+      for (const frame of frames) {
+        // Keep only data lines; comment lines (": ping") are keep-alives
+        const data = frame
+          .split("\n")
+          .filter((line) => line.startsWith("data:"))
+          .map((line) => line.slice(5).trimStart())
+          .join("\n");
+
+        if (!data) {
+          continue;
         }
 
-        const chunk = decoder.decode(value, { stream: true });
-        const lines = chunk.split("\n").filter((line) => line.trim());
+        let event: any;
+        try {
+          event = JSON.parse(data);
+        } catch (e) {
+          console.error("Error parsing event:", e, "Data:", data);
+          continue;
+        }
 
-        for (const line of lines) {
-          try {
-            const event = JSON.parse(line);
-            onEvent(event);
-          } catch (e) {
-            console.error("Error parsing event:", e, "Line:", line);
-          }
+        if (event.type === "final_start") {
+          finalDocuments = [];
+        } else if (event.type === "final_doc") {
+          finalDocuments.push(event.doc);
+        } else if (event.type === "final_end") {
+          onEvent({
+            type: "final",
+            content: event.content,
+            session_id: event.session_id,
+            documents: finalDocuments.length > 0 ? finalDocuments : undefined,
+          });
+          finalDocuments = [];
+        } else {
+          onEvent(event);
         }
       }
-    } catch (error) {
-      onError(error as Error);
     }
   }
 
+  /**
+   * Answer several independent questions about an analyzed video in one request
+   */
+  async batchQuery(request: BatchQueryRequest): Promise<BatchQueryResponse> {
+    const response = await fetch(`${this.baseURL}/api/query/batch`, {
+      method: "POST",
+      headers: {
+        "Content-Type": "application/json",
+      },
+      body: JSON.stringify(request),
+    });
+
+    if (!response.ok) {
+      throw new Error(`HTTP error! status: ${response.status}`);
+    }
+
+    return response.json();
+  }
+
   /**
    * Health check
    */
@@ -19,6 +19,7 @@ export interface SessionCreatedEvent extends StreamEvent {
 export interface AgentMessageEvent extends StreamEvent {
   type: "agent_message";
   agent: string;
+  chunk?: boolean;
   session_id?: string;
   metadata?: {
     agent_name?: string;
@@ -33,6 +34,25 @@ export interface FinalResponseEvent extends StreamEvent {
   documents?: RetrievedDocument[];
 }
 
+/**
+ * Wire frames of a streamed final response; the API client reassembles
+ * them into a single FinalResponseEvent
+ */
+export interface FinalStartEvent {
+  type: "final_start";
+}
+
+export interface FinalDocumentEvent {
+  type: "final_doc";
+  doc: RetrievedDocument;
+}
+
+export interface FinalEndEvent {
+  type: "final_end";
+  content: string;
+  session_id?: string;
+}
+
 export interface ErrorEvent extends StreamEvent {
   type: "error";
 }
@@ -65,6 +85,22 @@ export interface QueryRequest {
   question: string;
 }
 
+export interface BatchQueryRequest {
+  session_id: string;
+  questions: string[];
+}
+
+export interface BatchAnswer {
+  question: string;
+  response: string;
+  documents: RetrievedDocument[];
+}
+
+export interface BatchQueryResponse {
+  session_id: string;
+  answers: BatchAnswer[];
+}
+
 export type StreamEventType =
   | ProgressEvent
   | AgentMessageEvent